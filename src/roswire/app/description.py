@@ -19,6 +19,10 @@ from ..ros2 import ROS2FormatDatabase, ROS2PackageDatabase
 if typing.TYPE_CHECKING:
     from .app import App
 
+if not hasattr(yaml, "CSafeLoader"):
+    logger.warning("libyaml is unavailable: using slower YAML bindings")
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @attr.s(slots=True, frozen=True, auto_attribs=True)
 class AppDescription:
@@ -86,7 +90,7 @@ class AppDescription:
 
         try:
             with open(filename, "r") as f:
-                dict_ = yaml.safe_load(f)
+                dict_ = yaml.load(f, Loader=_SafeLoader)
         except FileNotFoundError:
             logger.exception(
                 "failed to load description for app "
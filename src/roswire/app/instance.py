@@ -43,6 +43,9 @@ class AppInstance:
         workspace on the host machine.
     _dockerblade: dockerblade.container.Container
         Provides access to the underlying Docker container.
+    _ros2: ROS2, optional
+        The ROS2 interface for this container, created on first access and
+        shared by later accesses so that its managers keep their state.
     """
 
     _dockerblade: dockerblade.container.Container = attr.ib()
@@ -52,6 +55,9 @@ class AppInstance:
         repr=False, init=False, eq=False
     )
     _host_workspace: Optional[str] = attr.ib(repr=False, default=None)
+    _ros2: Optional[ROS2] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
 
     def __attrs_post_init__(self) -> None:
         dockerblade = self._dockerblade
@@ -139,7 +145,10 @@ class AppInstance:
     @property
     def ros2(self) -> ROS2:
         """Provides access to ROS2 inside this application instance."""
-        return ROS2.for_app_instance(self)
+        if self._ros2 is None:
+            object.__setattr__(self, "_ros2", ROS2.for_app_instance(self))
+        assert self._ros2 is not None
+        return self._ros2
 
     def close(self) -> None:
         """Closes this application instance and destroys all resources."""
@@ -3,9 +3,22 @@
 This module provides code for decoding and deserialising binary ROS messages
 into Python data structures.
 """
+import array
 import functools
+import os
 import struct
-from typing import Any, BinaryIO, Callable, Dict, List, Optional, TypeVar
+import sys
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from .base import Duration, Time
 
@@ -28,6 +41,11 @@ _SIMPLE_TO_STRUCT = {
     "byte": "b",  # signed
 }
 
+_UINT32 = struct.Struct("<I")
+
+# times and durations are both encoded as a pair of uint32 values
+_TIME = struct.Struct("<II")
+
 
 def is_simple(typ: str) -> bool:
     """Determines whether a given type is a simple type."""
@@ -39,24 +57,43 @@ def get_pattern(typ: str) -> str:
     return _SIMPLE_TO_STRUCT[typ]
 
 
+@functools.lru_cache(maxsize=1024)
+def get_struct(pattern: str) -> struct.Struct:
+    """Returns a compiled struct for a given format string."""
+    return struct.Struct(pattern)
+
+
 def simple_decoder(typ: str) -> Callable[[bytes], Any]:
     """Returns a decoder for a specified simple type."""
-    pattern = "<" + get_pattern(typ)
+    unpack = get_struct("<" + get_pattern(typ)).unpack
 
     def decoder(v: bytes) -> Any:
-        return struct.unpack(pattern, v)[0]
+        return unpack(v)[0]
 
     def bool_decoder(v: bytes) -> bool:
-        return bool(struct.unpack(pattern, v)[0])
+        return bool(unpack(v)[0])
 
     return bool_decoder if typ == "bool" else decoder
 
 
+def _read_unsigned_byte(b: BinaryIO) -> int:
+    return b.read(1)[0]
+
+
+def _read_byte_as_bool(b: BinaryIO) -> bool:
+    return bool(b.read(1)[0])
+
+
 def simple_reader(typ: str) -> Callable[[BinaryIO], Any]:
     """Returns a reader for a specified simple type."""
-    pattern = "<" + get_pattern(typ)
+    # unsigned single-byte values can be read without unpacking
+    if get_pattern(typ) == "B":
+        if typ == "bool":
+            return _read_byte_as_bool
+        return _read_unsigned_byte
+
     decoder = simple_decoder(typ)
-    size = struct.calcsize(pattern)
+    size = get_struct("<" + get_pattern(typ)).size
 
     def reader(b: BinaryIO) -> Any:
         return decoder(b.read(size))
@@ -64,6 +101,23 @@ def simple_reader(typ: str) -> Callable[[BinaryIO], Any]:
     return reader
 
 
+def fused_simple_reader(
+    types: Sequence[str],
+) -> Callable[[BinaryIO], Tuple[Any, ...]]:
+    """Returns a reader for a contiguous sequence of simple values, which are
+    decoded together in a single unpacking operation."""
+    # bools are decoded via "?" so that no conversion is required
+    pattern = "".join("?" if t == "bool" else get_pattern(t) for t in types)
+    s = get_struct("<" + pattern)
+    unpack = s.unpack
+    size = s.size
+
+    def reader(b: BinaryIO) -> Tuple[Any, ...]:
+        return unpack(b.read(size))
+
+    return reader
+
+
 decode_int8 = simple_decoder("int8")
 decode_uint8 = simple_decoder("uint8")
 decode_int16 = simple_decoder("int16")
@@ -94,8 +148,7 @@ read_bool = simple_reader("bool")
 
 
 def decode_time(b: bytes) -> Time:
-    secs = decode_uint32(b[0:4])
-    nsecs = decode_uint32(b[4:8])
+    secs, nsecs = _TIME.unpack_from(b)
     return Time(secs, nsecs)
 
 
@@ -104,8 +157,7 @@ def read_time(b: BinaryIO) -> Time:
 
 
 def decode_duration(b: bytes) -> Duration:
-    secs = decode_uint32(b[0:4])
-    nsecs = decode_uint32(b[4:8])
+    secs, nsecs = _TIME.unpack_from(b)
     return Duration(secs, nsecs)
 
 
@@ -123,6 +175,12 @@ def read_sized(b: BinaryIO) -> bytes:
     return b.read(size)
 
 
+def skip_sized(b: BinaryIO) -> None:
+    """Skips over a variable-length block of bytes in a bytestream."""
+    size = read_uint32(b)
+    b.seek(size, os.SEEK_CUR)
+
+
 def read_fixed_length_string(size: int, b: BinaryIO) -> str:
     """Reads a fixed-length string from a bytestream."""
     return decode_string(b.read(size))
@@ -142,49 +200,113 @@ def string_reader(length: Optional[int] = None) -> Callable[[BinaryIO], str]:
         return functools.partial(read_fixed_length_string, length)
 
 
-def read_encoded_header(b: BinaryIO) -> Dict[str, bytes]:
-    """Reads an encoded header."""
+def _decode_header_fields(b: bytes, pos: int, end: int) -> Dict[str, bytes]:
+    """Decodes the fields of an encoded header that lie within b[pos:end]."""
     fields: Dict[str, bytes] = {}
-    header = read_sized(b)
-    while header:
-        size = decode_uint32(header[:4])
-        header = header[4:]
-        name, sep, value = header[:size].partition(b"\x3d")
-        if sep == "":
+    while pos < end:
+        size = _UINT32.unpack_from(b, pos)[0]
+        pos += 4
+        pos_end = pos + size
+        pos_sep = b.find(b"\x3d", pos, pos_end)
+        if pos_sep == -1:
             raise Exception("error reading header field")
-        fields[decode_string(name)] = value
-        header = header[size:]
+        name = decode_string(b[pos:pos_sep])
+        fields[name] = b[pos_sep + 1:pos_end]
+        pos = pos_end
     return fields
 
 
+def decode_encoded_header(
+    b: bytes, pos: int = 0
+) -> Tuple[Dict[str, bytes], int]:
+    """Decodes an encoded header that begins at a given position in a buffer.
+
+    Returns
+    -------
+    Tuple[Dict[str, bytes], int]
+        The fields of the header, and the position immediately after it.
+    """
+    size = _UINT32.unpack_from(b, pos)[0]
+    pos += 4
+    end = pos + size
+    return _decode_header_fields(b, pos, end), end
+
+
+def read_encoded_header(b: BinaryIO) -> Dict[str, bytes]:
+    """Reads an encoded header."""
+    header = read_sized(b)
+    return _decode_header_fields(header, 0, len(header))
+
+
 def read_string_dictionary(b: BinaryIO) -> Dict[str, str]:
     """Reads a variable-length string-to-string map."""
     field_to_bytes: Dict[str, bytes] = read_encoded_header(b)
     return {f: decode_string(v) for (f, v) in field_to_bytes.items()}
 
 
+def _read_fixed_byte_array(length: int, b: BinaryIO) -> List[int]:
+    return list(b.read(length))
+
+
+def _read_byte_array(b: BinaryIO) -> List[int]:
+    length = read_uint32(b)
+    return list(b.read(length))
+
+
+def _decode_numeric_array(typecode: str, b: bytes) -> List[Any]:
+    arr = array.array(typecode, b)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tolist()
+
+
 def simple_array_reader(
     typ: str, length: Optional[int] = None
 ) -> Callable[[BinaryIO], List[Any]]:
     """Returns a reader for a simple array."""
     base_pattern = get_pattern(typ)
 
+    # arrays of unsigned bytes (e.g., image data) can be converted directly
+    # to lists of ints without unpacking each element
+    if base_pattern == "B":
+        if length is not None:
+            return functools.partial(_read_fixed_byte_array, length)
+        return _read_byte_array
+
+    # other numeric arrays are decoded via array.array, provided that the
+    # platform uses the same item size as the ROS encoding
+    item_size = get_struct(f"<{base_pattern}").size
+    if array.array(base_pattern).itemsize == item_size:
+        decode = functools.partial(_decode_numeric_array, base_pattern)
+
+        if length is not None:
+            size_fixed = length * item_size
+
+            def fixed_array_reader(b: BinaryIO) -> List[Any]:
+                return decode(b.read(size_fixed))
+
+            return fixed_array_reader
+
+        def var_array_reader(b: BinaryIO) -> List[Any]:
+            length = read_uint32(b)
+            return decode(b.read(length * item_size))
+
+        return var_array_reader
+
     # fixed length: precompute pattern
     if length is not None:
-        pattern = f"<{length}{base_pattern}"
-        size = struct.calcsize(pattern)
+        s = get_struct(f"<{length}{base_pattern}")
 
         def fixed_reader(b: BinaryIO) -> List[Any]:
-            return list(struct.unpack(pattern, b.read(size)))
+            return list(s.unpack(b.read(s.size)))
 
         return fixed_reader
 
     # variable length
     def var_reader(b: BinaryIO) -> List[Any]:
         length = read_uint32(b)
-        pattern = f"<{length}{base_pattern}"
-        size = struct.calcsize(pattern)
-        return list(struct.unpack(pattern, b.read(size)))
+        s = get_struct(f"<{length}{base_pattern}")
+        return list(s.unpack(b.read(s.size)))
 
     return var_reader
 
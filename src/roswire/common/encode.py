@@ -3,15 +3,16 @@
 This module provides code for encoding and serialising Python data structures
 into their corresponding ROS binary representations.
 """
-import functools
-import struct
 from typing import Any, BinaryIO, Callable, Dict, Optional, Sequence, TypeVar
 
 from .base import Duration, Time
-from .decode import get_pattern
+from .decode import get_pattern, get_struct
 
 T = TypeVar("T")
 
+# times and durations are both encoded as a pair of uint32 values
+_TIME = get_struct("<II")
+
 
 def ignore(val: Any) -> None:
     """Used to prevent returning values in lambdas."""
@@ -20,8 +21,7 @@ def ignore(val: Any) -> None:
 
 def simple_encoder(typ: str) -> Callable[[Any], bytes]:
     """Returns an encoder for a specified simple type."""
-    pattern = "<" + get_pattern(typ)
-    return functools.partial(struct.pack, pattern)
+    return get_struct("<" + get_pattern(typ)).pack
 
 
 def sized_encoder(
@@ -30,11 +30,25 @@ def sized_encoder(
     def encoder(val: T) -> bytes:
         bin_size = encode_uint32(get_size(val))
         bin_content = encoder_content(val)
-        return bin_size + bin_content
+        return b"".join((bin_size, bin_content))
 
     return encoder
 
 
+def sized_writer(
+    encoder_content: Callable[[T], bytes]
+) -> Callable[[T, BinaryIO], None]:
+    """Returns a writer that writes the length-prefixed encoding of a value
+    directly to a given stream."""
+
+    def write(val: T, b: BinaryIO) -> None:
+        bin_content = encoder_content(val)
+        b.write(encode_uint32(len(bin_content)))
+        b.write(bin_content)
+
+    return write
+
+
 def writer(encoder: Callable[[Any], bytes]) -> Callable[[Any, BinaryIO], None]:
     return lambda v, b: ignore(b.write(encoder(v)))
 
@@ -60,11 +74,11 @@ encode_bool = simple_encoder("bool")
 
 
 def encode_time(time: Time) -> bytes:
-    return encode_uint32(time.secs) + encode_uint32(time.nsecs)
+    return _TIME.pack(time.secs, time.nsecs)
 
 
 def encode_duration(duration: Duration) -> bytes:
-    return encode_uint32(duration.secs) + encode_uint32(duration.nsecs)
+    return _TIME.pack(duration.secs, duration.nsecs)
 
 
 write_int8 = simple_writer("int8")
@@ -84,39 +98,32 @@ write_time = writer(encode_time)
 write_duration = writer(encode_duration)
 
 
-def write_encoded_header(contents: Dict[str, bytes], out: BinaryIO) -> None:
-    # write a length of zero for now and correct that length once the
-    # fields have been written
-    pos_size = out.tell()
-    write_uint32(0, out)
-    pos_content = out.tell()
-
+def encode_header(contents: Dict[str, bytes]) -> bytes:
+    """Encodes a header, including its length prefix, as a single buffer."""
+    bfr = bytearray()
     for name, bin_value in contents.items():
         bin_name = f"{name}=".encode("utf-8")
-        size_field = len(bin_name) + len(bin_value)
-        write_uint32(size_field, out)
-        out.write(bin_name)
-        out.write(bin_value)
+        bfr += encode_uint32(len(bin_name) + len(bin_value))
+        bfr += bin_name
+        bfr += bin_value
+    return encode_uint32(len(bfr)) + bfr
 
-    # correct the length
-    pos_end = out.tell()
-    size_total = pos_end - pos_content
-    out.seek(pos_size)
-    write_uint32(size_total, out)
-    out.seek(pos_end)
+
+def write_encoded_header(contents: Dict[str, bytes], out: BinaryIO) -> None:
+    out.write(encode_header(contents))
 
 
 def string_writer(
     length: Optional[int] = None,
 ) -> Callable[[str, BinaryIO], None]:
     """Returns a writer for (possibly fixed-length) strings."""
-    encoder: Callable[[str], bytes]
-    encode_content: Callable[[str], bytes] = str.encode
     if length is None:
-        encoder = sized_encoder(encode_content, str.__len__)
-    else:
-        encoder = encode_content
-    return writer(encoder)
+        return sized_writer(str.encode)
+
+    # fixed-length strings are padded with null bytes (or truncated) so that
+    # they occupy exactly the number of bytes expected by their readers
+    pack = get_struct(f"<{length}s").pack
+    return writer(lambda s: pack(s.encode()))
 
 
 def simple_array_writer(
@@ -126,14 +133,13 @@ def simple_array_writer(
     base_pattern = get_pattern(typ)
 
     if length is not None:
-        pattern = f"<{length}{base_pattern}"
-        return lambda arr, b: ignore(struct.pack(pattern, *arr))
+        pack = get_struct(f"<{length}{base_pattern}").pack
+        return lambda arr, b: ignore(b.write(pack(*arr)))
 
     def var_writer(arr: Sequence[Any], b: BinaryIO) -> None:
         length = len(arr)
         write_uint32(length, b)
-        pattern = f"<{length}{base_pattern}"
-        b.write(struct.pack(pattern, *arr))
+        b.write(get_struct(f"<{length}{base_pattern}").pack(*arr))
 
     return var_writer
 
@@ -6,12 +6,17 @@ from types import MappingProxyType
 from typing import Any, Dict, Generic, Mapping, Set, TypeVar
 
 import yaml
+from loguru import logger
 
 from .action import ActionFormat
 from .msg import MsgFormat
 from .package import PackageDatabase
 from .srv import SrvFormat
 
+if not hasattr(yaml, "CSafeLoader"):
+    logger.warning("libyaml is unavailable: using slower YAML bindings")
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 MF = TypeVar("MF", bound=MsgFormat)
 SF = TypeVar("SF", bound=SrvFormat)
 AF = TypeVar("AF", bound=ActionFormat)
@@ -116,4 +121,4 @@ class FormatDatabase(ABC, Generic[MF, SF, AF]):
     def load(cls, fn: str) -> "FormatDatabase":
         """Loads a format database from a given file on disk."""
         with open(fn, "r") as f:
-            return cls.from_dict(yaml.safe_load(f))
+            return cls.from_dict(yaml.load(f, Loader=_SafeLoader))
@@ -8,6 +8,8 @@ from typing import (
     Any,
     Collection,
     Dict,
+    Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -134,13 +136,21 @@ class LaunchConfig:
         return attr.evolve(self, roslaunch_files=roslaunch_files)
 
     def with_node(self, node: NodeConfig) -> "LaunchConfig":
-        logger.debug(f"adding node to config: {node}")
+        return self.with_nodes((node,))
+
+    def with_nodes(self, nodes: Iterable[NodeConfig]) -> "LaunchConfig":
+        """Adds several nodes at once, copying the set of nodes only once."""
         used_names = {n.full_name for n in self.nodes}
-        if node.full_name in used_names:
-            m = "multiple definitions of node [{}] in launch configuration"
-            m = m.format(node.full_name)
-            raise FailedToParseLaunchFile(m)
-        nodes = self.nodes | frozenset({node})
+        added: List[NodeConfig] = []
+        for node in nodes:
+            logger.debug(f"adding node to config: {node}")
+            if node.full_name in used_names:
+                m = "multiple definitions of node [{}] in launch configuration"
+                m = m.format(node.full_name)
+                raise FailedToParseLaunchFile(m)
+            used_names.add(node.full_name)
+            added.append(node)
+        nodes = self.nodes | frozenset(added)
         return attr.evolve(self, nodes=nodes)
 
     def to_xml_tree(self) -> ET.ElementTree:
@@ -5,7 +5,7 @@ launch configurations.
 """
 __all__ = ("LaunchContext",)
 
-from copy import deepcopy
+import sys
 from typing import Any, Dict, Optional, Sequence, Tuple
 
 import attr
@@ -28,6 +28,19 @@ class LaunchContext:
     remappings: Tuple[Tuple[str, str], ...] = attr.ib(default=())
     node_name: Optional[str] = attr.ib(default=None)
 
+    def _evolve(self, **changes: Any) -> "LaunchContext":
+        """
+        Creates a copy of this context with the given changes. Equivalent to
+        :func:`attr.evolve`, but avoids rebuilding the context via its
+        constructor, as contexts are derived very frequently when reading
+        launch files.
+        """
+        ctx = object.__new__(LaunchContext)
+        for name in _FIELD_NAMES:
+            value = changes[name] if name in changes else getattr(self, name)
+            object.__setattr__(ctx, name, value)
+        return ctx
+
     @property
     def is_node_context(self) -> bool:
         """Determines whether or not this context is node-local."""
@@ -36,27 +49,41 @@ class LaunchContext:
     def include_child(
         self, ns: Optional[str], filename: str
     ) -> "LaunchContext":
-        ctx = self.child(ns)
-        ctx = attr.evolve(
-            ctx, filename=filename, arg_names=(), include_resolve_dict={}
+        return self._evolve(
+            parent=self,
+            namespace=self._child_namespace(ns),
+            pass_all_args=False,
+            filename=filename,
+            arg_names=(),
+            include_resolve_dict={},
         )
-        return ctx
 
     def node_child(self, ns: Optional[str], name: str) -> "LaunchContext":
-        ctx = self.child(ns).child(name)
-        ctx = attr.evolve(ctx, node_name=name, include_resolve_dict={})
-        return ctx
+        ctx = self.child(ns)
+        return ctx._evolve(
+            parent=ctx,
+            namespace=ctx._child_namespace(name),
+            pass_all_args=False,
+            node_name=name,
+            include_resolve_dict={},
+        )
+
+    def _child_namespace(self, ns: Optional[str]) -> str:
+        """Computes the namespace of a child context."""
+        # a launch file typically uses only a handful of distinct namespaces
+        # across a large number of contexts, so they are interned
+        if ns is None:
+            return self.namespace
+        if ns.startswith("/") or ns == "~":
+            return sys.intern(ns)
+        return sys.intern(namespace_join(self.namespace, ns))
 
     def child(self, ns: Optional[str] = None) -> "LaunchContext":
         """Creates a child context that inherits from this context."""
-        if ns is None:
-            child_ns = self.namespace
-        elif ns.startswith("/") or ns == "~":
-            child_ns = ns
-        else:
-            child_ns = namespace_join(self.namespace, ns)
-        return attr.evolve(
-            self, parent=self, namespace=child_ns, pass_all_args=False
+        return self._evolve(
+            parent=self,
+            namespace=self._child_namespace(ns),
+            pass_all_args=False,
         )
 
     def with_remapping(self, frm: str, to: str) -> "LaunchContext":
@@ -77,18 +104,18 @@ class LaunchContext:
         # the given remapping
         remappings = tuple(r for r in self.remappings if r[0] != frm)
         remappings = remappings + ((frm, to),)
-        return attr.evolve(self, remappings=remappings)
+        return self._evolve(remappings=remappings)
 
     def with_pass_all_args(self) -> "LaunchContext":
         ctx = self
         if self.parent and "arg" in self.parent.resolve_dict:
             for var, val in self.parent.resolve_dict["arg"].items():
                 ctx = ctx.with_arg(var, value=val)
-        return attr.evolve(ctx, pass_all_args=True)
+        return ctx._evolve(pass_all_args=True)
 
     def process_include_args(self) -> "LaunchContext":
         if self.include_resolve_dict is None:
-            return attr.evolve(self, arg_names=())
+            return self._evolve(arg_names=())
 
         arg_dict = self.include_resolve_dict.get("arg", {})
         for arg in self.arg_names:
@@ -96,10 +123,15 @@ class LaunchContext:
                 m = f"include arg [{arg}] is missing value."
                 raise FailedToParseLaunchFile(m)
 
-        return attr.evolve(
-            self,
+        # contexts never modify their resolve dictionaries in place, so only
+        # the top level and its nested dictionaries need to be copied
+        resolve_dict = {
+            k: (v.copy() if isinstance(v, dict) else v)
+            for k, v in self.include_resolve_dict.items()
+        }
+        return self._evolve(
             arg_names=(),
-            resolve_dict=deepcopy(self.include_resolve_dict),
+            resolve_dict=resolve_dict,
             include_resolve_dict=None,
         )
 
@@ -114,11 +146,11 @@ class LaunchContext:
         logger.debug(f"loaded argv: {mappings}")
         resolve_dict = self.resolve_dict.copy()
         resolve_dict["arg"] = mappings
-        return attr.evolve(self, resolve_dict=resolve_dict)
+        return self._evolve(resolve_dict=resolve_dict)
 
     def with_env_arg(self, var: str, val: Any) -> "LaunchContext":
         env_args = self.env_args + ((var, val),)
-        return attr.evolve(self, env_args=env_args)
+        return self._evolve(env_args=env_args)
 
     def with_arg(
         self,
@@ -155,8 +187,16 @@ class LaunchContext:
             arg_dict[name] = arg_dict.get(name, default)
 
         # construct new context
-        ctx = attr.evolve(self, arg_names=arg_names)
         if use_include_resolve_dict:
-            return attr.evolve(ctx, include_resolve_dict=resolve_dict)
+            return self._evolve(
+                arg_names=arg_names, include_resolve_dict=resolve_dict
+            )
         else:
-            return attr.evolve(ctx, resolve_dict=resolve_dict)
+            return self._evolve(
+                arg_names=arg_names, resolve_dict=resolve_dict
+            )
+
+
+_FIELD_NAMES: Tuple[str, ...] = tuple(
+    field.name for field in attr.fields(LaunchContext)
+)
@@ -310,15 +310,15 @@ class MsgFormat(ABC, Generic[FIELD, CONSTANT]):
 
     @staticmethod
     def sections_from_string(text: str) -> t.List[str]:
-        sections: t.List[str] = [""]
-        section_index = 0
+        # the lines of each section are collected and joined once, rather
+        # than repeatedly extending an immutable string
+        sections: t.List[t.List[str]] = [[]]
         for line in (ss.strip() for ss in text.split("\n")):
             if line.startswith("---"):
-                section_index += 1
-                sections.append("")
+                sections.append([])
             else:
-                sections[section_index] += f"{line}\n"
-        return sections
+                sections[-1].append(f"{line}\n")
+        return ["".join(lines) for lines in sections]
 
     @classmethod
     def from_dict(
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import typing as t
-import xml.dom.minidom as dom
+import xml.etree.ElementTree as ET
 
 import attr
 from loguru import logger
@@ -37,30 +37,18 @@ class NodeletsInfo:
     def from_nodelet_xml(cls, contents: str) -> 'NodeletsInfo':
         libraries: t.Set['NodeletLibrary'] = set()
         contents = "<root>\n" + contents + "\n</root>"
-        tree = dom.parseString(contents)
-        root = get_xml_nodes_by_name('root', tree)[0]
-        libraries_dom = get_xml_nodes_by_name('library', root)
-        if not libraries_dom:
+        root = ET.fromstring(contents)
+        libraries_xml = root.findall('library')
+        if not libraries_xml:
             logger.warning(f"Expected there to be <library/> elements in nodelet_plugins.xml, but there are none.")
             logger.debug(contents)
-        for library_dom in libraries_dom:
-            assert isinstance(library_dom, dom.Element)
-            path = library_dom.getAttribute('path')
-            class_doms = get_xml_nodes_by_name(
-                'class',
-                library_dom
-            )
-            for class_dom in class_doms:
-                assert isinstance(class_dom, dom.Element)
-                name = class_dom.getAttribute('name')
-                type_ = class_dom.getAttribute('type')
+        for library_xml in libraries_xml:
+            path = library_xml.get('path', '')
+            for class_xml in library_xml.findall('class'):
+                name = class_xml.get('name', '')
+                type_ = class_xml.get('type', '')
                 libraries.add(NodeletLibrary(path=path,
                                              name=name,
                                              type_=type_,
                                              ))
         return NodeletsInfo(libraries=libraries)
-
-
-def get_xml_nodes_by_name(tag_name: str, tree: dom.Node) -> t.List[dom.Node]:
-    return [n for n in tree.childNodes
-            if n.nodeType == n.ELEMENT_NODE and n.tagName == tag_name]
@@ -145,6 +145,8 @@ class CMakeExtractor(abc.ABC):
     _app_instance: "AppInstance"
 
     _files_generated_by_cmake: t.Set[str] = attr.ib(factory=set)
+    _package_paths_cache: t.Dict[str, t.Set[str]] = \
+        attr.ib(factory=dict, init=False)
 
     @classmethod
     @abc.abstractmethod
@@ -169,6 +171,15 @@ class CMakeExtractor(abc.ABC):
     def _get_global_cmake_variables(self, package: Package) -> t.Dict[str, str]:
         ...
 
+    def _cached_package_paths(self, package: Package) -> t.Set[str]:
+        """Returns a copy of the paths for a given package. The paths are
+        computed at most once per package, since doing so may require several
+        queries to the underlying filesystem."""
+        if package.name not in self._package_paths_cache:
+            paths = self.package_paths(package)
+            self._package_paths_cache[package.name] = paths
+        return set(self._package_paths_cache[package.name])
+
     def get_nodelet_entrypoints(self, package: Package) -> t.Mapping[str, NodeletLibrary]:
         """
         Returns the potential nodelet entrypoints and classname for the package.
@@ -211,8 +222,14 @@ class CMakeExtractor(abc.ABC):
             return entrypoints
         return {}
 
-    def _info_from_cmakelists(self, cmakelists_path: str, package: Package) -> CMakeInfo:
-        contents = self._app_instance.files.read(cmakelists_path)
+    def _info_from_cmakelists(
+        self,
+        cmakelists_path: str,
+        package: Package,
+        contents: t.Optional[str] = None,
+    ) -> CMakeInfo:
+        if contents is None:
+            contents = self._app_instance.files.read(cmakelists_path)
         env = self._get_global_cmake_variables(package)
         env['cmakelists'] = cmakelists_path
         info = self._process_cmake_contents(contents, package, env)
@@ -464,11 +481,7 @@ class CMakeExtractor(abc.ABC):
             package,
             new_env,
         )
-        executables = {
-            **executables,
-            **{s: included_package_info.targets[s]
-               for s in included_package_info.targets}
-        }
+        executables.update(included_package_info.targets)
         return executables
 
     def __process_add_executable(
@@ -489,7 +502,7 @@ class CMakeExtractor(abc.ABC):
             name=name,
             language=SourceLanguage.CXX,
             sources=sources,
-            restrict_to_paths=self.package_paths(package),
+            restrict_to_paths=self._cached_package_paths(package),
             cmakelists_file=cmake_env['cmakelists'],
             cmakelists_line=cmake_env['cmakelists_line'],
         )
@@ -541,7 +554,7 @@ class CMakeExtractor(abc.ABC):
             name,
             SourceLanguage.CXX,
             sources,
-            self.package_paths(package),
+            self._cached_package_paths(package),
             cmakelists_file=cmake_env['cmakelists'],
             cmakelists_line=cmake_env['cmakelists_line'],
         )
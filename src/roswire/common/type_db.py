@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 __all__ = ("TypeDatabase",)
 
+import itertools
 from collections import OrderedDict
 from typing import (
     Any,
@@ -9,7 +10,9 @@ from typing import (
     Collection,
     Dict,
     Iterator,
+    List,
     Mapping,
+    Tuple,
     Type,
 )
 
@@ -18,6 +21,7 @@ import attr
 from .base import get_builtin, Time
 from .decode import (
     complex_array_reader,
+    fused_simple_reader,
     is_simple,
     read_duration,
     read_time,
@@ -112,15 +116,29 @@ class TypeDatabase(Mapping[str, Type[Message]]):
             m = f"unable to find factory for field: {field.name} [{field.typ}]"
             raise Exception(m)
 
-        fields: OrderedDict[str, Callable[[BinaryIO], Any]] = OrderedDict()
-        for field in fmt.fields:
-            fields[field.name] = get_factory(field)
-
+        # consecutive simple fields are read together by a single factory
+        # that returns a tuple of their values
+        steps: List[Tuple[bool, Callable[[BinaryIO], Any]]] = []
+        for is_simple_run, run in itertools.groupby(
+            fmt.fields, key=lambda f: f.is_simple
+        ):
+            run_fields = list(run)
+            if is_simple_run and len(run_fields) > 1:
+                types = [f.typ for f in run_fields]
+                steps.append((True, fused_simple_reader(types)))
+            else:
+                steps += [(False, get_factory(f)) for f in run_fields]
+
+        # values are read in the order in which the fields are declared,
+        # allowing them to be passed to the constructor by position
         def reader(cls: Type[Message], b: BinaryIO) -> Message:
-            values: Dict[str, Any] = {}
-            for name, factory in fields.items():
-                values[name] = factory(b)
-            return cls(**values)  # type: ignore
+            values: List[Any] = []
+            for is_fused, factory in steps:
+                if is_fused:
+                    values.extend(factory(b))
+                else:
+                    values.append(factory(b))
+            return cls(*values)  # type: ignore
 
         return reader
 
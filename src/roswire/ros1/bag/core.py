@@ -97,8 +97,13 @@ class BagHeader:
     chunk_count: int
 
 
-@attr.s(frozen=True, slots=True, auto_attribs=True)
-class IndexEntry:
+class IndexEntry(t.NamedTuple):
+    """
+    Describes the location of a single message within a bag. Entries are
+    named tuples, rather than attrs classes, since one is constructed for
+    every message in the bag when its index is read.
+    """
+
     time: Time
     pos: int
     offset: int
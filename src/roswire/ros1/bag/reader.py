@@ -1,17 +1,23 @@
 # -*- coding: utf-8 -*-
 __all__ = ("BagReader",)
 
-import heapq
+import bisect
+import bz2
+import functools
+import itertools
 import os
+import struct
 from functools import reduce
 from io import BytesIO
 from typing import (
-    BinaryIO,
+    Callable,
     Collection,
     Dict,
     Iterator,
     List,
+    NamedTuple,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -32,25 +38,72 @@ from .core import (
 )
 from ...common.base import Duration, Time
 from ...common.decode import (
+    decode_encoded_header,
     decode_string,
     decode_time,
     decode_uint32,
     decode_uint64,
     read_encoded_header,
-    read_sized,
-    read_time,
     read_uint32,
+    skip_sized,
 )
 from ...common.msg import Message
 from ...common.type_db import TypeDatabase
 
+# the encoding of a single entry within an INDEX_DATA record
+_UINT32 = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<III")
+
+# the encoding of a single (uid, count) pair within a CHUNK_INFO record
+_CHUNK_CONNECTION = struct.Struct("<II")
+
+# the maximum number of chunks whose contents are kept in memory
+CHUNK_CACHE_SIZE = 4
+
+
+class _ChunkInfo(NamedTuple):
+    """Summarises a chunk as described by its CHUNK_INFO record."""
+
+    pos_record: int
+    time_start: Time
+    time_end: Time
+    connections: List[ChunkConnection]
+
+
+class _EntryTimes(Sequence[Tuple[int, int]]):
+    """
+    Provides a read-only view of the times of a sorted list of index
+    entries, given as (secs, nsecs) tuples, that can be used with bisect.
+    """
+
+    def __init__(self, entries: Sequence[IndexEntry]) -> None:
+        self.__entries = entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __getitem__(self, i: int) -> Tuple[int, int]:  # type: ignore
+        time = self.__entries[i].time
+        return (time.secs, time.nsecs)
+
+
+def _entry_sort_key(entry: IndexEntry) -> Tuple[int, int, int, int]:
+    return (entry.time.secs, entry.time.nsecs, entry.pos, entry.offset)
+
 
 class BagReader:
     def __init__(self, fn: str, db_type: TypeDatabase) -> None:
         self.__fp = open(fn, "rb")
+        self.__fd = self.__fp.fileno()
         self.__db_type = db_type
         self.__size_bytes: int = os.path.getsize(fn)
 
+        # consecutive messages are typically stored within the same chunk,
+        # so we keep the contents of the most recently used chunks in memory
+        self.__load_chunk: Callable[[int], bytes] = functools.lru_cache(
+            maxsize=CHUNK_CACHE_SIZE
+        )(self._read_chunk)
+
         version = self._read_version()
         assert version == "#ROSBAG V2.0"
         logger.debug(f"bag version: {version}")
@@ -58,32 +111,37 @@ class BagReader:
         self.__header = self._read_header_record()
         logger.debug(f"bag header: {self.__header}")
 
-        # skip past chunks
-        self._seek(self.__header.index_pos)
+        # the connection and chunk info records are stored together after
+        # the chunks, at the end of the bag, so we read them into memory at
+        # once and decode them in place
+        index_pos = self.__header.index_pos
+        data = os.pread(self.__fd, self.__size_bytes - index_pos, index_pos)
+        pos = 0
 
         # obtain a list of all connections in the bag
         connections: List[ConnectionInfo] = []
         for _ in range(self.__header.conn_count):
-            conn = self._read_connection_record()
+            conn, pos = self._decode_connection_record(data, pos)
             connections.append(conn)
         self.__connections: Tuple[ConnectionInfo, ...] = tuple(connections)
 
         # obtain a summary of each chunk
-        chunks: List[Chunk] = []
+        chunk_infos: List[_ChunkInfo] = []
         for _ in range(self.__header.chunk_count):
-            info = self._read_chunk_info_record()
-            chunks.append(info)
+            info, pos = self._decode_chunk_info_record(data, pos)
+            chunk_infos.append(info)
+
+        # read the header of each chunk. the index data records that follow
+        # each chunk are only decoded once the chunk is needed.
+        self.__pos_to_index_end: Dict[int, int] = {}
+        chunks = self._read_chunks(chunk_infos)
         self.__chunks: Tuple[Chunk, ...] = tuple(chunks)
         self.__pos_to_chunk: Dict[int, Chunk] = {
             c.pos_record: c for c in chunks
         }
-
-        # read the index
-        self.__index: Index = self._read_index()
+        self.__chunk_indices: Dict[int, Index] = {}
+        self.__index: Optional[Index] = None
         logger.debug(f"topics: {self.topics}")
-        for conn_id, indices in self.__index.items():
-            topic = self.__connections[conn_id].topic
-            logger.debug(f"conn {conn_id} [{topic}]: {len(indices)} messages")
 
     @property
     def connections(self) -> Tuple[ConnectionInfo, ...]:
@@ -99,6 +157,8 @@ class BagReader:
 
     @property
     def index(self) -> Index:
+        if self.__index is None:
+            self.__index = self._read_index()
         return self.__index
 
     @property
@@ -128,40 +188,43 @@ class BagReader:
         """A mapping from topics to their respective types."""
         return {c.topic: self.__db_type[c.typ] for c in self.connections}
 
-    def _seek(self, pos: int, ptr: Optional[BinaryIO] = None) -> None:
-        ptr = ptr if ptr else self.__fp
-        ptr.seek(pos)
+    def _seek(self, pos: int) -> None:
+        self.__fp.seek(pos)
 
-    def _skip_sized(self, ptr: Optional[BinaryIO] = None) -> None:
-        ptr = ptr if ptr else self.__fp
-        ptr.seek(read_uint32(ptr), os.SEEK_CUR)
-
-    def _skip_record(self, ptr: Optional[BinaryIO] = None) -> None:
-        self._skip_sized(ptr)
-        self._skip_sized(ptr)
+    def _skip_sized(self) -> None:
+        skip_sized(self.__fp)
 
     def _read_version(self) -> str:
         return decode_string(self.__fp.readline()).rstrip()
 
     def _read_header(
-        self,
-        op_expected: Optional[OpCode] = None,
-        *,
-        ptr: Optional[BinaryIO] = None,
+        self, op_expected: Optional[OpCode] = None
     ) -> Dict[str, bytes]:
-        fields = read_encoded_header(ptr if ptr else self.__fp)
+        fields = read_encoded_header(self.__fp)
         if op_expected:
-            assert "op" in fields
-            op_actual: OpCode = OpCode(fields["op"])
-            if fields["op"] != op_expected.value:
-                m = (
-                    "unexpected opcode when reading header: "
-                    f"expected {op_expected.name} [{op_expected.hex}] "
-                    f"but was {op_actual.name} [{op_actual.hex}]."
-                )
-                raise Exception(m)
+            self._check_opcode(fields, op_expected)
         return fields
 
+    def _decode_header(
+        self, b: bytes, pos: int, op_expected: Optional[OpCode] = None
+    ) -> Tuple[Dict[str, bytes], int]:
+        fields, pos = decode_encoded_header(b, pos)
+        if op_expected:
+            self._check_opcode(fields, op_expected)
+        return fields, pos
+
+    @staticmethod
+    def _check_opcode(fields: Dict[str, bytes], op_expected: OpCode) -> None:
+        assert "op" in fields
+        op_actual: OpCode = OpCode(fields["op"])
+        if fields["op"] != op_expected.value:
+            m = (
+                "unexpected opcode when reading header: "
+                f"expected {op_expected.name} [{op_expected.hex}] "
+                f"but was {op_actual.name} [{op_actual.hex}]."
+            )
+            raise Exception(m)
+
     def _read_header_record(self) -> BagHeader:
         header = self._read_header(OpCode.HEADER)
         index_pos = decode_uint64(header["index_pos"])
@@ -170,9 +233,11 @@ class BagReader:
         self._skip_sized()
         return BagHeader(index_pos, conn_count, chunk_count)
 
-    def _read_connection_record(self) -> ConnectionInfo:
-        header = self._read_header(OpCode.CONNECTION_INFO)
-        conn = self._read_header()
+    def _decode_connection_record(
+        self, b: bytes, pos: int
+    ) -> Tuple[ConnectionInfo, int]:
+        header, pos = self._decode_header(b, pos, OpCode.CONNECTION_INFO)
+        conn, pos = self._decode_header(b, pos)
         logger.debug(f"conn record header: {header}")
         logger.debug(f"conn header: {conn}")
         callerid: Optional[str] = None
@@ -181,7 +246,7 @@ class BagReader:
             callerid = decode_string(conn["callerid"])
         if "latching" in conn:
             latching = decode_string(conn["latching"])
-        return ConnectionInfo(
+        info = ConnectionInfo(
             conn=decode_uint32(header["conn"]),
             callerid=callerid,
             latching=latching,
@@ -191,9 +256,12 @@ class BagReader:
             md5sum=decode_string(conn["md5sum"]),
             message_definition=decode_string(conn["message_definition"]),
         )  # noqa
+        return info, pos
 
-    def _read_chunk_info_record(self) -> Chunk:
-        header = self._read_header(OpCode.CHUNK_INFO)
+    def _decode_chunk_info_record(
+        self, b: bytes, pos: int
+    ) -> Tuple[_ChunkInfo, int]:
+        header, pos = self._decode_header(b, pos, OpCode.CHUNK_INFO)
         ver: int = decode_uint32(header["ver"])
         assert ver == 1
         pos_record: int = decode_uint64(header["chunk_pos"])
@@ -203,20 +271,22 @@ class BagReader:
 
         # obtain a summary of the number of messages for each connection
         # represented in this chunk
-        connections: List[ChunkConnection] = []
-        contents: bytes = read_sized(self.__fp)
-        for _ in range(num_connections):
-            uid = decode_uint32(contents[0:4])
-            count = decode_uint32(contents[4:8])
-            connections.append(ChunkConnection(uid, count))
-            contents = contents[8:]
-
-        # read connection index records?
-        assert not contents
-
-        # read the chunk header
-        pos_original = self.__fp.tell()
-        self.__fp.seek(pos_record)
+        size = _UINT32.unpack_from(b, pos)[0]
+        assert size == num_connections * _CHUNK_CONNECTION.size
+        pos += 4
+        pos_end = pos + size
+        connections = [
+            ChunkConnection(uid, count)
+            for uid, count in _CHUNK_CONNECTION.iter_unpack(b[pos:pos_end])
+        ]
+        info = _ChunkInfo(pos_record, time_start, time_end, connections)
+        return info, pos_end
+
+    def _read_chunk_record(self, info: _ChunkInfo) -> Chunk:
+        """
+        Reads the header of the chunk record at the current position and
+        skips over its data.
+        """
         header = self._read_header(OpCode.CHUNK)
         size_uncompressed = decode_uint32(header["size"])
         compression = Compression(decode_string(header["compression"]))
@@ -224,56 +294,108 @@ class BagReader:
 
         # determine the compressed size of the chunk data
         size_compressed = read_uint32(self.__fp)
-
-        # restore the original position of the read pointer
-        self.__fp.seek(pos_original)
+        self.__fp.seek(size_compressed, os.SEEK_CUR)
 
         chunk = Chunk(
-            pos_record=pos_record,
+            pos_record=info.pos_record,
             pos_data=pos_data,
-            time_start=time_start,
-            time_end=time_end,
+            time_start=info.time_start,
+            time_end=info.time_end,
             size_uncompressed=size_uncompressed,
             size_compressed=size_compressed,
             compression=compression,
-            connections=connections,
+            connections=info.connections,
         )
 
-        logger.debug("decoded chunk: {chunk}")
+        logger.debug(f"decoded chunk: {chunk}")
         return chunk
 
+    def _read_chunks(self, chunk_infos: Sequence[_ChunkInfo]) -> List[Chunk]:
+        # each chunk record is immediately followed by its index data
+        # records, which extend up to the start of the next chunk record (or
+        # the start of the index section for the last chunk).
+        chunk_infos = sorted(chunk_infos, key=lambda info: info.pos_record)
+        positions_end = [info.pos_record for info in chunk_infos[1:]]
+        positions_end.append(self.__header.index_pos)
+
+        chunks: List[Chunk] = []
+        for info, pos_end in zip(chunk_infos, positions_end):
+            self._seek(info.pos_record)
+            chunks.append(self._read_chunk_record(info))
+            self.__pos_to_index_end[info.pos_record] = pos_end
+        return chunks
+
+    def _read_chunk_index(self, chunk: Chunk) -> Index:
+        """
+        Returns the index entries for each connection within a given chunk,
+        decoding them upon first use.
+        """
+        cached = self.__chunk_indices.get(chunk.pos_record)
+        if cached is not None:
+            return cached
+
+        # the index data for the chunk is fetched with a single positional
+        # read and decoded in memory
+        logger.debug(f"reading index for chunk: {chunk}")
+        index: Index = {}
+        pos_index = chunk.pos_data + 4 + chunk.size_compressed
+        pos_end = self.__pos_to_index_end[chunk.pos_record]
+        data = os.pread(self.__fd, pos_end - pos_index, pos_index)
+        pos = 0
+        for _ in range(len(chunk.connections)):
+            pos = self._decode_index_record(data, pos, chunk.pos_record, index)
+        self.__chunk_indices[chunk.pos_record] = index
+        return index
+
     def _read_index(self) -> Index:
         logger.debug("reading index")
-        index: Index = {c.conn: [] for c in self.connections}
-        for chunk in self.chunks:
-            logger.debug(f"reading index for chunk: {chunk}")
-            pos = chunk.pos_record
-            self._seek(pos)
-            self._skip_record()
-            for _ in range(len(chunk.connections)):
-                self._read_index_record(pos, index)
+        # connections without any messages are omitted from the index
+        chunk_indices = [self._read_chunk_index(c) for c in self.chunks]
+        index: Index = {}
+        for connection in self.connections:
+            uid = connection.conn
+            entries = list(
+                itertools.chain.from_iterable(
+                    chunk_index.get(uid, ()) for chunk_index in chunk_indices
+                )
+            )
+            if entries:
+                index[uid] = entries
         logger.debug("read index")
-
-        logger.debug("pruning empty connections from index")
-        for c in [cc for cc in index if not index[cc]]:
-            del index[c]
-            # TODO delete connection!
-        logger.debug("pruned index")
         return index
 
-    def _read_index_record(self, pos_chunk: int, index: Index) -> None:
-        header = self._read_header(OpCode.INDEX_DATA)
+    def _decode_index_record(
+        self,
+        data: bytes,
+        pos: int,
+        pos_chunk: int,
+        index: Index,
+    ) -> int:
+        """
+        Decodes the index data record at a given position in a buffer and
+        returns the position immediately after it.
+        """
+        header, pos = decode_encoded_header(data, pos)
+        self._check_opcode(header, OpCode.INDEX_DATA)
         ver = decode_uint32(header["ver"])
         uid = decode_uint32(header["conn"])
         count = decode_uint32(header["count"])
         assert ver == 1
 
-        read_uint32(self.__fp)  # skip size
-        for _ in range(count):
-            time = read_time(self.__fp)
-            offset = read_uint32(self.__fp)
-            entry = IndexEntry(time=time, pos=pos_chunk, offset=offset)
-            index[uid].append(entry)
+        # each entry is a fixed-length (secs, nsecs, offset) triple, so the
+        # entire block is decoded in a single pass
+        size = _UINT32.unpack_from(data, pos)[0]
+        assert size == count * _INDEX_ENTRY.size
+        pos += 4
+        pos_end = pos + size
+        # each connection has exactly one index data record per chunk
+        index[uid] = [
+            IndexEntry(time=Time(secs, nsecs), pos=pos_chunk, offset=offset)
+            for secs, nsecs, offset in _INDEX_ENTRY.iter_unpack(
+                data[pos:pos_end]
+            )
+        ]
+        return pos_end
 
     def _get_connections(
         self, topics: Optional[Collection[str]] = None
@@ -293,32 +415,70 @@ class BagReader:
         time_start: Optional[Time] = None,
         time_end: Optional[Time] = None,
     ) -> Iterator[IndexEntry]:
-        entries = heapq.merge(*[self.__index[c.conn] for c in connections])
-        for entry in entries:
-            if time_start and entry.time < time_start:
-                continue
-            if time_end and entry.time > time_end:
-                return
-            yield entry
+        # only the chunks that overlap the time window and contain at least
+        # one of the given connections need to have their index decoded
+        uids = {c.conn for c in connections}
+
+        def is_relevant(chunk: Chunk) -> bool:
+            if time_start and chunk.time_end < time_start:
+                return False
+            if time_end and chunk.time_start > time_end:
+                return False
+            return any(c.uid in uids for c in chunk.connections)
+
+        chunks = [chunk for chunk in self.chunks if is_relevant(chunk)]
+
+        # the entries for each connection are sorted by a single call to
+        # sorted, which merges the already-ordered runs for each connection
+        # using plain tuple comparisons rather than IndexEntry.__lt__
+        entries = sorted(
+            itertools.chain.from_iterable(
+                self._read_chunk_index(chunk).get(uid, ())
+                for chunk in chunks
+                for uid in uids
+            ),
+            key=_entry_sort_key,
+        )
 
-    def fetch_message_data_record(self, pos: int, offset: int) -> BagMessage:
-        # find the chunk to which the message belongs
-        # read the contents of that chunk to a bytes buffer
+        # find the range of entries that fall within the time window via a
+        # binary search over their times
+        times = _EntryTimes(entries)
+        lo = 0
+        hi = len(entries)
+        if time_start:
+            lo = bisect.bisect_left(times, (time_start.secs, time_start.nsecs))
+        if time_end:
+            end = (time_end.secs, time_end.nsecs + 1)
+            hi = bisect.bisect_left(times, end, lo)
+        for i in range(lo, hi):
+            yield entries[i]
+
+    def _read_chunk(self, pos: int) -> bytes:
+        """Reads the contents of the chunk at a given position."""
+        # the size of the chunk data is already known, so we can fetch its
+        # contents with a single positional read that leaves the read
+        # pointer of the file untouched
         chunk = self.__pos_to_chunk[pos]
-        self._seek(chunk.pos_data)
+        pos_contents = chunk.pos_data + 4
+        contents = os.pread(self.__fd, chunk.size_compressed, pos_contents)
         if chunk.compression == Compression.NONE:
-            bfr = BytesIO(read_sized(self.__fp))
-        else:
-            raise NotImplementedError
+            return contents
+        if chunk.compression == Compression.BZ2:
+            return bz2.decompress(contents)
+        raise NotImplementedError
+
+    def fetch_message_data_record(self, pos: int, offset: int) -> BagMessage:
+        # find the chunk to which the message belongs and parse the records
+        # within its contents in place
+        chunk = self.__load_chunk(pos)
 
-        # seek position of message data record
+        # find the message data record
         # - skip any preceding connection records
-        self._seek(offset, bfr)
         while True:
-            header = self._read_header(ptr=bfr)
+            header, offset = decode_encoded_header(chunk, offset)
             op = OpCode(header["op"])
             if op == OpCode.CONNECTION_INFO:
-                self._skip_sized(bfr)
+                offset += 4 + _UINT32.unpack_from(chunk, offset)[0]
                 continue
             if op == OpCode.MESSAGE_DATA:
                 conn_id = decode_uint32(header["conn"])
@@ -335,7 +495,9 @@ class BagReader:
         msg_typ = self.__db_type[msg_typ_name]
 
         # read the raw message data
-        raw = read_sized(bfr)
+        size = _UINT32.unpack_from(chunk, offset)[0]
+        offset += 4
+        raw = chunk[offset:offset + size]
         content = msg_typ.read(BytesIO(raw))
         msg = BagMessage(topic, t, content)
         logger.debug(f"decoded message: {msg}")
@@ -9,6 +9,7 @@ https://github.com/ros/ros_comm/blob/melodic-devel/tools/rosbag/src/rosbag/bag.p
 """
 __all__ = ("BagWriter",)
 
+import struct
 from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Type
 
 from loguru import logger
@@ -24,17 +25,33 @@ from .core import (
     OpCode,
 )
 from ...common.encode import (
+    encode_header,
     encode_time,
     encode_uint32,
     encode_uint64,
     write_encoded_header,
-    write_time,
     write_uint32,
 )
 from ...common.msg import Message
 
+BIN_VERSION = "#ROSBAG V2.0\n".encode("utf-8")
 BIN_CHUNK_INFO_VERSION = encode_uint32(1)
-BIN_INDEX_VERSION = encode_uint32(1)
+INDEX_VERSION = 1
+
+# MESSAGE_DATA and INDEX_DATA records are written for every message and for
+# every connection in every chunk, respectively. their headers contain a
+# fixed sequence of fixed-size fields, so each header, together with the
+# size of the data that follows it, is encoded by a single precompiled
+# struct. each field is given by its length, its name, and its value, and
+# the header is preceded by its total length.
+_MESSAGE_DATA_HEADER = struct.Struct("<I I5sI I5sII I3sc I")
+_INDEX_DATA_HEADER = struct.Struct("<I I4sI I5sI I6sI I3sc I")
+_INDEX_ENTRY = struct.Struct("<III")
+
+# the size of the write buffer used for the underlying bag file. headers are
+# written as a series of small fields, so a large buffer ensures that those
+# writes are coalesced in memory rather than issued as individual syscalls.
+BUFFER_SIZE = 1 << 20
 
 
 class BagWriter:
@@ -49,7 +66,7 @@ class BagWriter:
 
     def __init__(self, fn: str) -> None:
         self.__fn = fn
-        self.__fp: BinaryIO = open(fn, "wb")
+        self.__fp: BinaryIO = open(fn, "wb", buffering=BUFFER_SIZE)
         self.__connections: Dict[str, ConnectionInfo] = {}
         self.__chunks: List[Chunk] = []
         self.__pos_header = 0
@@ -67,16 +84,14 @@ class BagWriter:
             fields["op"] = code.value
         write_encoded_header(fields, self.__fp)
 
-    def _write_header_record(self) -> None:
-        logger.debug("writing bag header record")
-        self.__fp.seek(self.__pos_header)
-        self._write_header(
-            OpCode.HEADER,
+    def _encode_header_record(self) -> bytes:
+        bin_header = encode_header(
             {
                 "chunk_count": encode_uint32(len(self.__chunks)),
                 "conn_count": encode_uint32(len(self.__connections)),
                 "index_pos": encode_uint64(self.__pos_index),
-            },
+                "op": OpCode.HEADER.value,
+            }
         )
 
         # ensure the bag header record is 4096 characters long by padding it
@@ -84,14 +99,16 @@ class BagWriter:
         #
         # the ROS bag format doesn't consider size fields when computing the
         # length of the header and the record
-        pos_current = self.__fp.tell()
         size = 4096
-        size_header = pos_current - self.__pos_header - 4
+        size_header = len(bin_header) - 4
         size_padding = size - size_header
-
-        write_uint32(size_padding, self.__fp)
         padding = b"\x20" * size_padding
-        self.__fp.write(padding)
+        return b"".join((bin_header, encode_uint32(size_padding), padding))
+
+    def _write_header_record(self) -> None:
+        logger.debug("writing bag header record")
+        self.__fp.seek(self.__pos_header)
+        self.__fp.write(self._encode_header_record())
         logger.debug("wrote bag header record")
 
     def _write_message(
@@ -102,17 +119,22 @@ class BagWriter:
         logger.debug(f"writing message on connection [{connection.topic}]")
 
         pos_header = self.__fp.tell()
-        self._write_header(
-            OpCode.MESSAGE_DATA,
-            {
-                "conn": encode_uint32(connection.conn),
-                "time": encode_time(message.time),
-            },
-        )
-
         bin_data = message.message.encode()
-        size_data = len(bin_data)
-        write_uint32(size_data, self.__fp)
+        bin_header = _MESSAGE_DATA_HEADER.pack(
+            _MESSAGE_DATA_HEADER.size - 8,
+            9,
+            b"conn=",
+            connection.conn,
+            13,
+            b"time=",
+            message.time.secs,
+            message.time.nsecs,
+            4,
+            b"op=",
+            OpCode.MESSAGE_DATA.value,
+            len(bin_data),
+        )
+        self.__fp.write(bin_header)
         self.__fp.write(bin_data)
 
         # update index
@@ -195,19 +217,28 @@ class BagWriter:
     ) -> None:
         logger.debug(f"writing connection index [{conn}]")
         num_entries = len(entries)
-        size_data = num_entries * 12
-        self._write_header(
-            OpCode.INDEX_DATA,
-            {
-                "ver": BIN_INDEX_VERSION,
-                "conn": encode_uint32(conn),
-                "count": encode_uint32(num_entries),
-            },
+        bin_header = _INDEX_DATA_HEADER.pack(
+            _INDEX_DATA_HEADER.size - 8,
+            8,
+            b"ver=",
+            INDEX_VERSION,
+            9,
+            b"conn=",
+            conn,
+            10,
+            b"count=",
+            num_entries,
+            4,
+            b"op=",
+            OpCode.INDEX_DATA.value,
+            num_entries * _INDEX_ENTRY.size,
         )
-        write_uint32(size_data, self.__fp)
-        for entry in entries:
-            write_time(entry.time, self.__fp)
-            write_uint32(entry.offset, self.__fp)
+        bin_entries = b"".join(
+            _INDEX_ENTRY.pack(e.time.secs, e.time.nsecs, e.offset)
+            for e in entries
+        )
+        self.__fp.write(bin_header)
+        self.__fp.write(bin_entries)
 
     def _write_chunk(
         self, compression: Compression, messages: Iterable[BagMessage]
@@ -296,12 +327,12 @@ class BagWriter:
         Writes a sequence of messages to the bag.
         Any existing bag file contents will be overwritten.
         """
-        self.__fp.truncate(0)
-        self.__fp.write("#ROSBAG V2.0\n".encode("utf-8"))
+        self.__fp.seek(0)
+        self.__fp.truncate()
 
-        # create a placeholder header for now
-        self.__pos_header = self.__fp.tell()
-        self._write_header_record()
+        # write the version line together with a placeholder header
+        self.__pos_header = len(BIN_VERSION)
+        self.__fp.write(BIN_VERSION + self._encode_header_record())
 
         # for now, we write to a single, uncompressed chunk
         # each chunk record is followed by a sequence of IndexData record
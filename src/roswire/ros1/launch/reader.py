@@ -1,6 +1,8 @@
 __all__ = ("ROS1LaunchFileReader",)
 
+import collections
 import os
+import re
 import shlex
 import subprocess
 import typing
@@ -10,6 +12,7 @@ from typing import (
     Any,
     Callable,
     Collection,
+    Iterable,
     Optional,
     overload,
     Sequence,
@@ -42,6 +45,19 @@ if typing.TYPE_CHECKING:
 
 _TAG_TO_LOADER = {}
 
+# the child tags that are processed within <node> and <include> tags
+_NODE_CHILD_TAGS = frozenset({"env", "remap", "param", "rosparam"})
+_INCLUDE_CHILD_TAGS = frozenset({"env", "arg"})
+
+# matches the name of the arg in each $(arg name) substitution
+_R_ARG_NAME = re.compile(r"\$\(arg ([^ )]*)")
+
+# the maximum number of resolved substitutions that are kept during a read
+_RESOLVE_CACHE_SIZE = 4096
+
+# identifies a substitution by its string and the values of the args it uses
+_ResolveKey = Tuple[str, Tuple[Any, ...]]
+
 Loader = Callable[
     ["ROS1LaunchFileReader", LaunchContext, LaunchConfig, ET.Element],
     Tuple[LaunchContext, LaunchConfig],
@@ -150,10 +166,12 @@ def tag(
             elem: ET.Element,
         ) -> Tuple[LaunchContext, LaunchConfig]:
             logger.debug(f"parsing <{name}> tag")
-            for attribute in elem.attrib:
-                if attribute not in legal_attributes:
-                    m = f"<{name}> tag contains illegal attribute: {attribute}"
-                    raise FailedToParseLaunchFile(m)
+            if not legal_attributes.issuperset(elem.attrib):
+                attribute = next(
+                    a for a in elem.attrib if a not in legal_attributes
+                )
+                m = f"<{name}> tag contains illegal attribute: {attribute}"
+                raise FailedToParseLaunchFile(m)
 
             # should we process this element?
             if not self._ifunless_check(elem, ctx):
@@ -170,6 +188,9 @@ def tag(
 class ROS1LaunchFileReader(LaunchFileReader):
     _shell: dockerblade.Shell
     _files: dockerblade.FileSystem
+    _resolve_cache: "t.OrderedDict[_ResolveKey, str]" = attr.ib(
+        factory=collections.OrderedDict, init=False, repr=False
+    )
 
     @classmethod
     def for_app_instance(cls, app_instance: "AppInstance") -> LaunchFileReader:
@@ -188,11 +209,12 @@ class ROS1LaunchFileReader(LaunchFileReader):
         return root
 
     def _load_tags(
-        self, ctx: LaunchContext, cfg: LaunchConfig, tags: Sequence[ET.Element]
+        self, ctx: LaunchContext, cfg: LaunchConfig, tags: Iterable[ET.Element]
     ) -> Tuple[LaunchContext, LaunchConfig]:
-        for tag in (t for t in tags if t.tag in _TAG_TO_LOADER):
-            loader = _TAG_TO_LOADER[tag.tag]
-            ctx, cfg = loader(self, ctx, cfg, tag)
+        for tag in tags:
+            loader = _TAG_TO_LOADER.get(tag.tag)
+            if loader:
+                ctx, cfg = loader(self, ctx, cfg, tag)
         return ctx, cfg
 
     @tag("group", ["ns"])
@@ -204,8 +226,7 @@ class ROS1LaunchFileReader(LaunchFileReader):
         ctx_child = ctx.child(ns)
 
         # handle nested tags
-        nested_tags = list(tag)
-        ctx_child, cfg = self._load_tags(ctx_child, cfg, nested_tags)
+        ctx_child, cfg = self._load_tags(ctx_child, cfg, tag)
 
         return ctx, cfg
 
@@ -366,8 +387,7 @@ class ROS1LaunchFileReader(LaunchFileReader):
             cfg = cfg.with_clear_param(clear_ns)
 
         # handle nested tags
-        allowed = {"env", "remap", "param", "rosparam"}
-        nested_tags = [t for t in tag if t.tag in allowed]
+        nested_tags = (t for t in tag if t.tag in _NODE_CHILD_TAGS)
         ctx_child, cfg = self._load_tags(ctx_child, cfg, nested_tags)
 
         # locate node executable and determine the type
@@ -465,14 +485,14 @@ class ROS1LaunchFileReader(LaunchFileReader):
             ctx_child = ctx_child.with_pass_all_args()
 
         # handle child tags
-        child_tags = [t for t in tag if t.tag in ("env", "arg")]
+        child_tags = (t for t in tag if t.tag in _INCLUDE_CHILD_TAGS)
         ctx_child, cfg = self._load_tags(ctx_child, cfg, child_tags)
         ctx_child = ctx_child.process_include_args()
         logger.debug(f"prepared include context: {ctx_child}")
 
         logger.debug("loading include file")
         launch = self._parse_file(include_filename)
-        ctx_child, cfg = self._load_tags(ctx_child, cfg, list(launch))
+        ctx_child, cfg = self._load_tags(ctx_child, cfg, launch)
 
         return ctx, cfg
 
@@ -538,15 +558,20 @@ class ROS1LaunchFileReader(LaunchFileReader):
         self, elem: ET.Element, attrib: str, ctx: LaunchContext
     ) -> Optional[str]:
         """Reads the string value of an optional attribute of an element."""
-        if attrib not in elem.attrib:
+        val = elem.get(attrib)
+        if val is None:
             return None
-        return self._read_required(elem, attrib, ctx)
+        return self._resolve_args(val, ctx)
 
     def _read_required(
         self, elem: ET.Element, attrib: str, ctx: LaunchContext
     ) -> str:
         """Reads the string value of a required attribute of an element."""
-        return self._resolve_args(elem.attrib[attrib], ctx)
+        val = elem.get(attrib)
+        if val is None:
+            m = f"<{elem.tag}> tag is missing required attribute: {attrib}"
+            raise FailedToParseLaunchFile(m)
+        return self._resolve_args(val, ctx)
 
     def _ifunless_check(self, elem: ET.Element, ctx: LaunchContext) -> bool:
         """Determines whether an element should be parsed."""
@@ -563,12 +588,35 @@ class ROS1LaunchFileReader(LaunchFileReader):
 
     def _resolve_args(self, s: str, ctx: LaunchContext) -> str:
         """Resolves all substitution args in a given string."""
+        # strings without any substitution args are left unchanged
+        if "$(" not in s:
+            return s
+
+        # anon, dirname, and eval may depend on (or modify) the state of the
+        # context, so their results are never cached. the results of other
+        # substitutions depend only on the values of the args that they
+        # refer to (if any) and the state of the container, which is assumed
+        # not to change during a read. the cache is cleared by each read.
+        key: Optional[_ResolveKey] = None
+        if not any(k in s for k in ("$(anon", "$(dirname", "$(eval")):
+            args = ctx.resolve_dict.get("arg", {})
+            values = tuple(args.get(n) for n in _R_ARG_NAME.findall(s))
+            key = (s, values)
+            if key in self._resolve_cache:
+                self._resolve_cache.move_to_end(key)
+                return self._resolve_cache[key]
+
         logger.debug(f"resolve [{s}] with context: {ctx.resolve_dict}")
         resolve_ctx = ctx.resolve_dict or {}
         resolver = ArgumentResolver(
             shell=self._shell, files=self._files, context=resolve_ctx
         )
-        return resolver.resolve(s)
+        resolved = resolver.resolve(s)
+        if key is not None:
+            self._resolve_cache[key] = resolved
+            if len(self._resolve_cache) > _RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+        return resolved
 
     def read(
         self, fn: str, argv: Optional[Sequence[str]] = None
@@ -585,13 +633,14 @@ class ROS1LaunchFileReader(LaunchFileReader):
         * http://wiki.ros.org/roslaunch/XML/node
         * http://docs.ros.org/kinetic/api/roslaunch/html/roslaunch.xmlloader.XmlLoader-class.html
         """
+        self._resolve_cache.clear()
         cfg = LaunchConfig()
         ctx = LaunchContext(namespace="/", filename=fn)
         if argv:
             ctx = ctx.with_argv(argv)
 
         launch = self._parse_file(fn)
-        ctx, cfg = self._load_tags(ctx, cfg, list(launch))
+        ctx, cfg = self._load_tags(ctx, cfg, launch)
         logger.debug(f"launch configuration: {cfg}")
         return cfg
 
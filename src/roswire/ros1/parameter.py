@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 __all__ = ("ParameterServer",)
 
+import time
 import xmlrpc.client
-from typing import Any, Iterator, Mapping, Sequence
+from typing import Any, Dict, Iterator, Mapping, Sequence, Tuple
 
 from .. import exceptions
 
+# the number of seconds for which the result of a cached lookup is reused
+CACHE_TTL = 0.25
+
 
 class ParameterServer(Mapping[str, Any]):
     """
@@ -21,6 +25,7 @@ class ParameterServer(Mapping[str, Any]):
         """
         self.__caller_id = "/.roswire"
         self.__connection = connection
+        self.__cache: Dict[str, Tuple[float, bool, Any]] = {}
 
     def __len__(self) -> int:
         """Returns a count of the number of registered parameters."""
@@ -80,21 +85,69 @@ class ParameterServer(Mapping[str, Any]):
             if no parameter with the given key is found on the
             parameter server.
         """
+        found, value = self.__fetch(key)
+        if not found:
+            raise exceptions.ParameterNotFoundError(key)
+        return value
+
+    def __fetch(self, key: str) -> Tuple[bool, Any]:
+        """
+        Fetches the value of a given parameter from the server, along with
+        whether or not that parameter exists.
+        """
         # fmt: off
         code, msg, result = \
             self.__connection.getParam(self.__caller_id, key)  # type: ignore
         # fmt: on
         if code == -1:
-            raise exceptions.ParameterNotFoundError(key)
+            return False, None
         if code != 1:
             raise exceptions.ROSWireException("bad API call")
-        return result
+        return True, result
+
+    def __fetch_cached(self, key: str) -> Tuple[bool, Any]:
+        """Fetches a parameter, reusing the result of a recent lookup."""
+        now = time.monotonic()
+        entry = self.__cache.get(key)
+        if entry is not None and now - entry[0] < CACHE_TTL:
+            return entry[1], entry[2]
+        found, value = self.__fetch(key)
+        self.__cache[key] = (now, found, value)
+        return found, value
+
+    def contains_cached(self, key: str) -> bool:
+        """
+        Determines whether the parameter server contains a given parameter
+        or tree, reusing the result of any lookup for the same key within
+        the last :code:`CACHE_TTL` seconds. Changes made via this proxy
+        are always observed.
+        """
+        return self.__fetch_cached(key)[0]
+
+    def get_cached(self, key: str) -> Any:
+        """
+        Fetches the value of a given parameter, reusing the result of any
+        lookup for the same key within the last :code:`CACHE_TTL` seconds.
+        Changes made via this proxy are always observed.
+
+        Raises
+        ------
+        ParameterNotFoundError
+            if no parameter with the given key is found on the
+            parameter server.
+        """
+        found, value = self.__fetch_cached(key)
+        if not found:
+            raise exceptions.ParameterNotFoundError(key)
+        return value
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
         Sets the value of a parameter on the server. If the value is a
         dictionary, it will be treated as a parameter tree.
         """
+        # any parameter within the tree may be affected
+        self.__cache.clear()
         # fmt: off
         code, msg, result = \
             self.__connection.setParam(self.__caller_id, key, value)  # type: ignore  # noqa
@@ -116,6 +169,7 @@ class ParameterServer(Mapping[str, Any]):
             if no parameter or parameter tree is found with the given
             key on the server.
         """
+        self.__cache.clear()
         # fmt: off
         code, msg, result = \
             self.__connection.deleteParam(self.__caller_id, key)  # type: ignore  # noqa
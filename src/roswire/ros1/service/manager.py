@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 __all__ = ("ServiceManager",)
 
+import shlex
+import time
 import typing
 import xmlrpc.client
-from typing import AbstractSet, Iterator, Mapping
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import urlparse
 
 import dockerblade
@@ -15,6 +27,16 @@ from ... import exceptions
 if typing.TYPE_CHECKING:
     from ...app import AppDescription
 
+T = TypeVar("T")
+
+# used to separate the output for each service when fetching types in bulk
+_SERVICE_MARKER = "__roswire_service__:"
+
+# the number of seconds for which the results of queries to the master are
+# reused. this allows code that iterates over the services and then fetches
+# each of them to avoid repeating the same queries.
+CACHE_TTL = 0.25
+
 
 class ServiceManager(Mapping[str, Service]):
     """Provides access to the registered services on a ROS graph."""
@@ -33,9 +55,118 @@ class ServiceManager(Mapping[str, Service]):
         self.__state_probe: SystemStateProbe = (
             SystemStateProbe.via_xmlrpc_connection(self.__api)
         )
+        self.__cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # the type of a service can't change unless the service is
+        # re-advertised, so the type of each service is cached together
+        # with the URL at which it was advertised
+        self.__type_cache: Dict[str, Tuple[str, str]] = {}
+        self.__has_prefetched_types = False
+
+    def invalidate(self) -> None:
+        """Discards the cached results of any previous service queries."""
+        self.__cache.clear()
+        self.__type_cache.clear()
+        self.__has_prefetched_types = False
+
+    def __cached(self, key: Tuple[str, str], fetch: Callable[[], T]) -> T:
+        """Fetches a value, reusing its last result if that is recent."""
+        now = time.monotonic()
+        entry = self.__cache.get(key)
+        if entry is not None and now - entry[0] < CACHE_TTL:
+            return entry[1]
+        value = fetch()
+        self.__cache[key] = (now, value)
+        return value
 
     def __get_service_names(self) -> AbstractSet[str]:
-        return set(self.__state_probe().services.keys())
+        return self.__cached(("names", ""), self.__fetch_service_names)
+
+    def __fetch_service_names(self) -> AbstractSet[str]:
+        names = set(self.__state_probe().services.keys())
+        # forget about services that are no longer registered
+        for name in [n for n in self.__type_cache if n not in names]:
+            del self.__type_cache[name]
+        for key in [k for k in self.__cache if k[0] == "url"]:
+            if key[1] not in names:
+                del self.__cache[key]
+        return names
+
+    def __lookup_service_url(self, name: str) -> str:
+        """Returns the URL of a given service within the container."""
+        code: int
+        msg: str
+        url_container: str
+        # fmt: off
+        code, msg, url_container = \
+            self.__api.lookupService("/.roswire", name)  # type: ignore
+        # fmt: on
+        if code == -1:
+            raise exceptions.ServiceNotFoundError(name)
+        if code != 1:
+            m = "an unexpected error occurred when retrieving services"
+            m = f"{m}: {msg} (code: {code})"
+            raise exceptions.ROSWireException(m)
+        return url_container
+
+    def __fetch_service_type(self, name: str) -> str:
+        """Returns the name of the type of a given service."""
+        command = f"rosservice type {name}"
+        try:
+            return self.__shell.check_output(command, text=True)
+        except dockerblade.exceptions.CalledProcessError as error:
+            m = f"unable to determine type for service [{name}]"
+            raise exceptions.ROSWireException(m) from error
+
+    def prefetch_types(self, names: Iterable[str]) -> Dict[str, str]:
+        """Determines the types of several services with a single command.
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            The names of the services.
+
+        Returns
+        -------
+        Dict[str, str]
+            The name of the type of each service whose type could be
+            determined, indexed by the name of the service.
+        """
+        name_to_url: Dict[str, str] = {}
+        for name in names:
+            try:
+                name_to_url[name] = self.__cached(
+                    ("url", name), lambda: self.__lookup_service_url(name)
+                )
+            except exceptions.ServiceNotFoundError:
+                continue
+        if not name_to_url:
+            return {}
+
+        # the output for each service is preceded by a marker line that
+        # gives the name of that service
+        names_quoted = " ".join(shlex.quote(name) for name in name_to_url)
+        command = (
+            f"for service in {names_quoted}; do "
+            f'echo "{_SERVICE_MARKER}$service"; '
+            'rosservice type "$service" || true; '
+            "done"
+        )
+        try:
+            output = self.__shell.check_output(command, text=True)
+        except dockerblade.exceptions.CalledProcessError as error:
+            m = "unable to determine types for services"
+            raise exceptions.ROSWireException(m) from error
+
+        name_to_type: Dict[str, str] = {}
+        name = ""
+        for line in output.splitlines():
+            line = line.strip()
+            if line.startswith(_SERVICE_MARKER):
+                name = line[len(_SERVICE_MARKER):]
+            elif line and name in name_to_url:
+                name_to_type[name] = line
+                self.__type_cache[name] = (name_to_url[name], line)
+        return name_to_type
 
     def __len__(self) -> int:
         """The number of advertised services on this ROS graph."""
@@ -43,7 +174,15 @@ class ServiceManager(Mapping[str, Service]):
 
     def __iter__(self) -> Iterator[str]:
         """Returns an iterator over the names of all registered services."""
-        yield from self.__get_service_names()
+        names = self.__get_service_names()
+
+        # services are typically fetched after being iterated over, so we
+        # determine all of their types at once ahead of time
+        if not self.__has_prefetched_types:
+            self.__has_prefetched_types = True
+            self.prefetch_types(names)
+
+        yield from names
 
     def __getitem__(self, name: str) -> Service:
         """Fetches a proxy for a service with a given name.
@@ -63,31 +202,20 @@ class ServiceManager(Mapping[str, Service]):
         ServiceNotFound
             If no service is found with the given name.
         """
-        code: int
-        msg: str
-        url_container: str
-        # fmt: off
-        code, msg, url_container = \
-            self.__api.lookupService("/.roswire", name)  # type: ignore
-        # fmt: on
-        if code == -1:
-            raise exceptions.ServiceNotFoundError(name)
-        if code != 1:
-            m = "an unexpected error occurred when retrieving services"
-            m = f"{m}: {msg} (code: {code})"
-            raise exceptions.ROSWireException(m)
+        url_container = self.__cached(
+            ("url", name), lambda: self.__lookup_service_url(name)
+        )
 
         # convert URL to host network
         parsed = urlparse(url_container)
         url_host = f"{parsed.scheme}://{self.__host_ip_master}:{parsed.port}"
 
         # find the format for the service
-        command = f"rosservice type {name}"
-        try:
-            name_fmt = self.__shell.check_output(command, text=True)
-        except dockerblade.exceptions.CalledProcessError as error:
-            m = f"unable to determine type for service [{name}]"
-            raise exceptions.ROSWireException(m) from error
+        entry = self.__type_cache.get(name)
+        if entry is None or entry[0] != url_container:
+            entry = (url_container, self.__fetch_service_type(name))
+            self.__type_cache[name] = entry
+        name_fmt = entry[1]
         fmt = self.__description.formats.services[name_fmt]
         return Service(
             name=name,
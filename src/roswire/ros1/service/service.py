@@ -7,10 +7,18 @@ from typing import Optional
 import attr
 import dockerblade
 import yaml
+from loguru import logger
 
 from ... import exceptions
 from ...common import Message, MsgFormat, SrvFormat
 
+# use the libyaml bindings for encoding requests and decoding responses
+# whenever they are available, as they are substantially faster
+if not hasattr(yaml, "CSafeLoader"):
+    logger.warning("libyaml is unavailable: using slower YAML bindings")
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 if typing.TYPE_CHECKING:
     from ...app import AppDescription
 
@@ -51,7 +59,9 @@ class Service:
         if not message:
             yml = "{}"
         else:
-            yml = yaml.dump(message.to_dict())
+            yml = yaml.dump(
+                message.to_dict(), Dumper=_SafeDumper, default_flow_style=True
+            ).rstrip()
         command = f"rosservice call {self.name} '{yml}'"
         try:
             output = self._shell.check_output(command, text=True)
@@ -68,6 +78,6 @@ class Service:
         if not fmt_response:
             return None
 
-        d = yaml.safe_load(output)
+        d = yaml.load(output, Loader=_SafeLoader)
         db_type = self._description.types
         return db_type.from_dict(fmt_response, d)
@@ -31,7 +31,7 @@ class ROS1SrvFormat(SrvFormat[ROS1MsgFormat]):
         if len(sections) > 2:
             raise ParsingError(f"Can only be up to two sections for {name} svc for {package}")
 
-        s_req = sections[0] if len(sections) == 1 else ""
+        s_req = sections[0]
         s_res = sections[1] if len(sections) == 2 else ""
 
         if s_req:
@@ -1,10 +1,22 @@
 # -*- coding: utf-8 -*-
 __all__ = ("ROS2LaunchManager",)
 
+import fnmatch
 import os
 import shlex
 import typing
-from typing import Collection, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import attr
 from loguru import logger
@@ -14,11 +26,14 @@ from ... import exceptions as exc
 from ...common.launch.config import LaunchConfig
 from ...common.launch.controller import ROSLaunchController
 
+# precedes the launch files found in each package when searching packages
+_PACKAGE_MARKER = "__roswire_package__:"
+
 if typing.TYPE_CHECKING:
     from ... import AppInstance
 
 
-@attr.s(eq=False)
+@attr.s(eq=False, slots=True)
 class ROS2LaunchManager:
     """
     Provides access to `ros2 launch
@@ -29,6 +44,18 @@ class ROS2LaunchManager:
     """
 
     _app_instance: "AppInstance" = attr.ib()
+    _located: Dict[Tuple[str, str], str] = attr.ib(
+        factory=dict, init=False, repr=False
+    )
+    _structures: Dict[str, Sequence[Dict[str, Any]]] = attr.ib(
+        factory=dict, init=False, repr=False
+    )
+    _reader: ROS2LaunchFileReader = attr.ib(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._reader = ROS2LaunchFileReader(
+            self._app_instance, structures=self._structures
+        )
 
     @classmethod
     def for_app_instance(
@@ -64,8 +91,7 @@ class ROS2LaunchManager:
             If the given launch file could not be found in the package.
         """
         filename = self.locate(filename, package=package)
-        reader = ROS2LaunchFileReader(self._app_instance)
-        return reader.read(filename, argv)
+        return self._reader.read(filename, argv)
 
     def write(
         self, config: LaunchConfig, *, filename: Optional[str] = None
@@ -111,23 +137,94 @@ class ROS2LaunchManager:
         LaunchFileNotFound
             If the given launch file could not be found in the package.
         """
-        if not package:
-            assert os.path.isabs(filename)
-            return filename
-        else:
-            app_description = self._app_instance.app.description
-            package_description = app_description.packages[package]
-            package_location = package_description.path
-            paths = self._app_instance.files.find(package_location, filename)
-            for path in paths:
-                if package in path:
-                    logger.debug(
-                        "determined location of launch file"
-                        f" [{filename}] in package [{package}]: "
-                        f"{path}"
-                    )
-                    return path
-        raise exc.LaunchFileNotFound(path=filename)
+        return self.locate_many([(filename, package)])[0]
+
+    def locate_many(
+        self, requests: Sequence[Tuple[str, Optional[str]]]
+    ) -> List[str]:
+        """Locates several launch files at once.
+
+        Parameters
+        ----------
+        requests: Sequence[Tuple[str, Optional[str]]]
+            A sequence of launch files to locate, each given as a pair of
+            a filename and an optional package name, as accepted by
+            :meth:`locate`.
+
+        Returns
+        -------
+        List[str]
+            The absolute path to each of the launch files, in order.
+
+        Raises
+        ------
+        PackageNotFound
+            If a given package could not be found.
+        LaunchFileNotFound
+            If a given launch file could not be found in its package.
+        """
+        # searching a package is costly, so launch files that were located
+        # previously are reused without checking the container again. the
+        # remaining launch files are searched for using a single command.
+        package_to_filenames: Dict[str, Dict[str, None]] = {}
+        for filename, package in requests:
+            if package and (package, filename) not in self._located:
+                filenames = package_to_filenames.setdefault(package, {})
+                filenames[filename] = None
+        if package_to_filenames:
+            self._find(package_to_filenames)
+
+        located: List[str] = []
+        for filename, package in requests:
+            if not package:
+                assert os.path.isabs(filename)
+                located.append(filename)
+            else:
+                located.append(self._located[(package, filename)])
+        return located
+
+    def _find(
+        self, package_to_filenames: Mapping[str, Collection[str]]
+    ) -> None:
+        """Searches the given packages for launch files."""
+        packages = self._app_instance.app.description.packages
+        commands: List[str] = []
+        for package, filenames in package_to_filenames.items():
+            location = shlex.quote(packages[package].path)
+            names = " -o ".join(
+                f"-name {shlex.quote(filename)}" for filename in filenames
+            )
+            commands.append(
+                f"echo {_PACKAGE_MARKER}{shlex.quote(package)}; "
+                f"find {location} \\( {names} \\) 2>/dev/null || true"
+            )
+        shell = self._app_instance.shell
+        output = shell.check_output("; ".join(commands), text=True)
+
+        package_to_paths: Dict[str, List[str]] = {}
+        paths: List[str] = []
+        for line in output.splitlines():
+            line = line.strip()
+            if line.startswith(_PACKAGE_MARKER):
+                package = line[len(_PACKAGE_MARKER):]
+                paths = package_to_paths.setdefault(package, [])
+            elif line:
+                paths.append(line)
+
+        for package, filenames in package_to_filenames.items():
+            for filename in filenames:
+                for path in package_to_paths.get(package, []):
+                    name = os.path.basename(path)
+                    if package in path and fnmatch.fnmatchcase(name, filename):
+                        break
+                else:
+                    raise exc.LaunchFileNotFound(path=filename)
+                logger.debug(
+                    "determined location of launch file"
+                    f" [{filename}] in package [{package}]: "
+                    f"{path}"
+                )
+                self._located[(package, filename)] = path
 
     def launch(
         self,
@@ -175,15 +272,41 @@ class ROS2LaunchManager:
         LaunchFileNotFound
             If the given launch file could not be found in the package.
         """
-        shell = self._app_instance.shell
-        if not args:
-            args = {}
-        if not launch_prefixes:
-            launch_prefixes = {}
-
         if node_to_remappings or launch_prefixes:
             m = "Requires self.read: not yet implemented"
             raise NotImplementedError(m)
+        launch = self.prepare(filename, package=package, prefix=prefix)
+        return launch(args)
+
+    def prepare(
+        self,
+        filename: str,
+        *,
+        package: Optional[str] = None,
+        prefix: Optional[str] = None,
+    ) -> Callable[..., ROSLaunchController]:
+        """Prepares a launch file to be launched, possibly many times.
+
+        The launch command is constructed once, and the returned callable
+        only needs to append the given launch arguments before launching.
+
+        Parameters
+        ----------
+        filename: str
+            The name of the launch file, or an absolute path to the launch
+            file inside the container.
+        package: str, optional
+            The name of the package to which the launch file belongs.
+        prefix: str, optional
+            An optional prefix to add before the roslaunch command.
+
+        Returns
+        -------
+        Callable[..., ROSLaunchController]
+            A function that accepts an optional mapping of launch arguments
+            and launches the file with those arguments.
+        """
+        shell = self._app_instance.shell
         if package:
             filename_without_path = os.path.basename(filename)
             cmd = [
@@ -194,12 +317,20 @@ class ROS2LaunchManager:
         else:
             m = "Not yet implemented when package is None"
             raise NotImplementedError(m)
-        launch_args: List[str] = [f"{arg}:={val}" for arg, val in args.items()]
-        cmd += launch_args
         if prefix:
             cmd = [prefix] + cmd
-        cmd_str = " ".join(cmd)
-        popen = shell.popen(cmd_str, stdout=True, stderr=True)
-        return ROSLaunchController(filename=filename, popen=popen)
+        cmd_prefix = " ".join(cmd)
+
+        def launch(
+            args: Optional[Mapping[str, Union[int, str]]] = None
+        ) -> ROSLaunchController:
+            cmd_str = cmd_prefix
+            if args:
+                launch_args = " ".join(f"{k}:={v}" for k, v in args.items())
+                cmd_str = f"{cmd_str} {launch_args}"
+            popen = shell.popen(cmd_str, stdout=True, stderr=True)
+            return ROSLaunchController(filename=filename, popen=popen)
+
+        return launch
 
     __call__ = launch
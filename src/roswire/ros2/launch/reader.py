@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
+import hashlib
 import json
+import operator
 import os
 import shlex
 import typing
-from typing import Any, Dict, Mapping, Optional, Sequence
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
 
 import attr
 import pkg_resources
@@ -12,13 +14,43 @@ from loguru import logger
 from ...common.launch.config import ExecutableType, LaunchConfig, NodeConfig
 from ...common.launch.reader import LaunchFileReader
 
+_CONTAINER_SCRIPT = "/launch_extractor.py"
+_HOST_SCRIPT = pkg_resources.resource_filename(
+    "roswire", "resources/launch_extractor._py"
+)
+_SCRIPT_SHA256 = hashlib.sha256(
+    pkg_resources.resource_string("roswire", "resources/launch_extractor._py")
+).hexdigest()
+_CACHE_DIR_ENV = "ROSWIRE_LAUNCH_CACHE_DIR"
+
+# the fields that the extraction script provides for every node
+_REQUIRED_NODE_FIELDS = operator.itemgetter(
+    "name", "namespace", "package", "executable_path", "executable_type"
+)
+
 if typing.TYPE_CHECKING:
     from ... import AppInstance
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ROS2LaunchFileReader(LaunchFileReader):
+    """
+    Reads ROS 2 launch files by running an extraction script inside the
+    container.
+
+    Attributes
+    ----------
+    _structures: Dict[str, Sequence[Dict[str, Any]]], optional
+        An optional in-memory cache of the node templates extracted from
+        launch files, indexed by their cache key.
+    _script_copied: bool
+        Whether an up-to-date copy of the extraction script is known to
+        exist inside the container.
+    """
+
     _app_instance: "AppInstance"
+    _structures: Optional[Dict[str, Sequence[Dict[str, Any]]]] = None
+    _script_copied: bool = attr.ib(default=False, init=False, repr=False)
 
     @classmethod
     def for_app_instance(
@@ -49,23 +81,97 @@ class ROS2LaunchFileReader(LaunchFileReader):
         LaunchFileNotFound
             If the given launch file could not be found in the package.
         """
-        logger.debug("Copying launch extraction script")
+        nodes = self._parse_structure(fn)
+        return self._evaluate(nodes, argv)
+
+    def _parse_structure(self, fn: str) -> Sequence[Dict[str, Any]]:
+        """
+        Extracts the node templates described by a given launch file.
+
+        When caching is enabled by setting :code:`ROSWIRE_LAUNCH_CACHE_DIR`,
+        the result is reused for launch files with identical contents, both
+        in memory and on disk. Note that changes to any files included by
+        the launch file are not detected.
+        """
+        key = self._cache_key(fn)
+        if key and self._structures is not None and key in self._structures:
+            logger.debug(f"reusing parsed launch file: {fn}")
+            return self._structures[key]
+
+        cache_filename: Optional[str] = None
+        if key:
+            cache_dir = os.environ[_CACHE_DIR_ENV]
+            os.makedirs(cache_dir, exist_ok=True)
+            cache_filename = os.path.join(cache_dir, f"{key}.json")
+
+        if cache_filename and os.path.isfile(cache_filename):
+            logger.debug(f"reading cached launch config: {cache_filename}")
+            with open(cache_filename, "rb") as f:
+                nodes = json.loads(f.read())
+        else:
+            self._copy_script()
+            files = self._app_instance.files
+            nodes = self._process_launch_on_app_instance(fn, files)
+            if cache_filename:
+                logger.debug(f"caching launch config: {cache_filename}")
+                with open(cache_filename, "w") as f:
+                    json.dump(nodes, f)
+
+        if key and self._structures is not None:
+            self._structures[key] = nodes
+        return nodes
+
+    def _evaluate(
+        self,
+        nodes: Sequence[Dict[str, Any]],
+        argv: Optional[Sequence[str]] = None,
+    ) -> LaunchConfig:
+        """Builds a launch config from a set of parsed node templates."""
+        return self._read_launch_config_from_dict(nodes)
+
+    def _copy_script(self) -> None:
+        """Copies the extraction script unless an identical copy exists."""
+        if self._script_copied:
+            return
+        tag = f"{_CONTAINER_SCRIPT}.sha256"
+        command = f"test -f {_CONTAINER_SCRIPT} && cat {tag} 2>/dev/null"
+        shell = self._app_instance.shell
+        output = shell.check_output(f"{command} || true", text=True)
+        if output.strip() == _SCRIPT_SHA256:
+            logger.debug("launch extraction script is up to date")
+        else:
+            logger.debug("Copying launch extraction script")
+            files = self._app_instance.files
+            files.copy_from_host(_HOST_SCRIPT, _CONTAINER_SCRIPT)
+            files.write(tag, _SCRIPT_SHA256)
+        self._script_copied = True
+
+    def _cache_key(self, fn: str) -> Optional[str]:
+        """
+        Computes the key under which the parsed contents of a given launch
+        file are cached, or returns :code:`None` if caching is disabled or
+        the contents of the launch file cannot be read.
+        """
+        if not os.environ.get(_CACHE_DIR_ENV):
+            return None
         files = self._app_instance.files
-        host_script = pkg_resources.resource_filename(
-            "roswire", "resources/launch_extractor._py"
-        )
-        files.copy_from_host(host_script, "/launch_extractor.py")
+        if not files.isfile(fn):
+            return None
+        contents = files.read(fn, binary=True)
+        assert isinstance(contents, bytes)
 
-        config_nodes = self._process_launch_on_app_instance(fn, files)
-        lc = self._read_launch_config_from_dict(config_nodes)
-        return lc
+        key = hashlib.sha256()
+        key.update(self._app_instance.app.sha256.encode("utf-8"))
+        key.update(_SCRIPT_SHA256.encode("utf-8"))
+        key.update(hashlib.sha256(contents).digest())
+        return key.hexdigest()
 
     def _read_launch_config_from_dict(
         self,
         config_nodes: Sequence[Dict[str, Any]],
     ) -> LaunchConfig:
         cfg = LaunchConfig()
-        cfg = self._load_launch_objects(cfg, [list(config_nodes)])
+        cfg = self._load_launch_objects(cfg, config_nodes)
         logger.debug(f"launch configuration: {cfg}")
         return cfg
 
@@ -75,51 +181,54 @@ class ROS2LaunchFileReader(LaunchFileReader):
         assert self._app_instance is not None
         output = shlex.quote(os.path.basename(filename) + ".json")
         cmd = (
-            f"python3 /launch_extractor.py --output"
+            f"python3 {_CONTAINER_SCRIPT} --output"
             f" {output} {shlex.quote(filename)}"
         )
         logger.debug(f"Running the script in the container: {cmd}")
         self._app_instance.shell.check_call(cmd)
         logger.debug(f"Reading {output} on container")
-        config_json = files.read(output)
+        # the JSON is parsed directly from the raw bytes of the file
+        config_json = files.read(output, binary=True)
         config_nodes = json.loads(config_json)
         return config_nodes
 
     def _load_launch_objects(
-        self, cfg: LaunchConfig, node_list: Sequence[Sequence[Dict[str, Any]]]
+        self, cfg: LaunchConfig, nodes: Iterable[Dict[str, Any]]
     ) -> LaunchConfig:
-        cfg_with_nodes_added = cfg
-        for nodes in node_list:
-            for node in nodes:
-                if node["__TYPE__"] == "Node":
-                    nc = self._read_node_from_dict(node)
-                    cfg_with_nodes_added = cfg_with_nodes_added.with_node(nc)
-                else:
-                    # The __TYPE__ isn't known (this is for futureproofing)
-                    raise NotImplementedError
-        return cfg_with_nodes_added
+        return cfg.with_nodes(self._read_node_from_dict(n) for n in nodes)
 
     def _read_node_from_dict(self, node: Mapping[str, Any]) -> NodeConfig:
-        args = " ".join(node.get("args", []))
-        remappings = tuple(node.get("remappings", []))
+        if node["__TYPE__"] != "Node":
+            # The __TYPE__ isn't known (this is for futureproofing)
+            raise NotImplementedError
+        (
+            name,
+            namespace,
+            package,
+            executable_path,
+            executable_type,
+        ) = _REQUIRED_NODE_FIELDS(node)
+        get = node.get
         nc = NodeConfig(
-            name=node["name"],
-            namespace=node["namespace"],
-            package=node["package"],
-            executable_path=node["executable_path"],
-            executable_type=ExecutableType[node["executable_type"]],
-            remappings=remappings,
-            filename=node.get("filename"),
-            output=node.get("output"),
-            required=node.get("required", False),
-            respawn=node.get("respawn", False),
-            respawn_delay=float(node.get("respawn_delay", 0.0)),
-            env_args=tuple(node.get("env_args", [])),
-            cwd=node.get("cwd"),
-            args=args,
-            launch_prefix=node.get("launch_prefix"),
+            name=name,
+            namespace=namespace,
+            package=package,
+            executable_path=executable_path,
+            executable_type=ExecutableType[executable_type],
+            remappings=(
+                tuple(node["remappings"]) if "remappings" in node else ()
+            ),
+            filename=get("filename"),
+            output=get("output"),
+            required=get("required", False),
+            respawn=get("respawn", False),
+            respawn_delay=float(get("respawn_delay", 0.0)),
+            env_args=tuple(node["env_args"]) if "env_args" in node else (),
+            cwd=get("cwd"),
+            args=" ".join(node["args"]) if "args" in node else "",
+            launch_prefix=get("launch_prefix"),
             # ROS 2 has no type in nodes, derive it from
             # the full executable path
-            typ=os.path.basename(node["executable_path"]),
+            typ=os.path.basename(executable_path),
         )
         return nc
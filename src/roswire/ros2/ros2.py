@@ -41,7 +41,7 @@ class ROS2:
         object.__setattr__(self, "_state_probe", state_probe)
         object.__setattr__(self, "launch", launch)
         object.__setattr__(self,
-                           "__package_source_extractor",
+                           "_package_source_extractor",
                            package_source_extractor)
 
     @classmethod
@@ -2,6 +2,7 @@
 __all__ = ("ROS2PackageSourceExtractor",)
 
 import os.path
+import shlex
 import typing as t
 
 import attr
@@ -14,7 +15,7 @@ if t.TYPE_CHECKING:
     from .. import AppInstance
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ROS2PackageSourceExtractor(CMakeExtractor):
 
     @classmethod
@@ -42,6 +43,54 @@ class ROS2PackageSourceExtractor(CMakeExtractor):
             raise NotImplementedError("Do not know how to process ROS2 "
                                       "packages with setup.py yet.")
 
+        self._no_package_information(path_to_package)
+
+    def get_cmake_info_for_packages(
+        self,
+        packages: t.Sequence[Package],
+    ) -> t.Dict[str, CMakeInfo]:
+        """
+        Obtains the CMake information for several packages, indexed by
+        package name, using a single command to check for and read the
+        CMakeLists.txt of every package.
+        """
+        # for each package, the script writes a single line that either
+        # gives the size of its CMakeLists.txt, followed by its contents,
+        # or else reports whether a setup.py was found
+        paths = " ".join(shlex.quote(p.path) for p in packages)
+        command = (
+            f"for p in {paths}; do "
+            'if [ -f "$p/CMakeLists.txt" ]; then '
+            'echo "C $(wc -c < "$p/CMakeLists.txt")"; '
+            'cat "$p/CMakeLists.txt"; '
+            'elif [ -f "$p/setup.py" ]; then echo S; '
+            "else echo N; fi; done"
+        )
+        output = self._app_instance.shell.check_output(command, text=False)
+
+        package_to_info: t.Dict[str, CMakeInfo] = {}
+        pos = 0
+        for package in packages:
+            pos_eol = output.index(b"\n", pos)
+            kind, _, size = output[pos:pos_eol].decode("utf-8").partition(" ")
+            pos = pos_eol + 1
+            if kind == "S":
+                raise NotImplementedError("Do not know how to process ROS2 "
+                                          "packages with setup.py yet.")
+            if kind != "C":
+                self._no_package_information(package.path)
+
+            pos_end = pos + int(size)
+            contents = output[pos:pos_end].decode("utf-8")
+            pos = pos_end
+            cmakelists_path = os.path.join(package.path, "CMakeLists.txt")
+            package_to_info[package.name] = self._info_from_cmakelists(
+                cmakelists_path, package, contents
+            )
+        return package_to_info
+
+    @staticmethod
+    def _no_package_information(path_to_package: str) -> t.NoReturn:
         logger.error(f"There is no package information inside "
                      f"{path_to_package}. Is it a package soure directory?")
         raise ValueError(f"No pacakge information for {path_to_package}.")
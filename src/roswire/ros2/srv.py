@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 __all__ = ("ROS2SrvFormat",)
 
+import functools
 from typing import Any, Dict, Optional
 
 import dockerblade
@@ -22,6 +23,14 @@ class ROS2SrvFormat(SrvFormat[ROS2MsgFormat]):
 
     @classmethod
     def from_string(cls, package: str, name: str, s: str) -> "ROS2SrvFormat":
+        return cls._from_string(package, name, s)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _from_string(
+        cls, package: str, name: str, s: str
+    ) -> "ROS2SrvFormat":
+        # formats are immutable, so the same definition is only parsed once
         req: Optional[ROS2MsgFormat] = None
         res: Optional[ROS2MsgFormat] = None
         name_req = f"{name}Request"
@@ -31,7 +40,7 @@ class ROS2SrvFormat(SrvFormat[ROS2MsgFormat]):
         if len(sections) > 2:
             raise ParsingError(f"Can only be up to two sections for {name} svc for {package}")
 
-        s_req = sections[0] if len(sections) == 1 else ""
+        s_req = sections[0]
         s_res = sections[1] if len(sections) == 2 else ""
 
         if s_req:
@@ -18,6 +18,21 @@ _SERVICES = "serv"
 _SUBSCRIBERS = "sub"
 _PUBLISHERS = "pub"
 
+# used to separate the info for each node when probing the system
+_NODE_MARKER = b"__roswire_node__:"
+
+# maps the section headers in the output of `ros2 node info` to the kind of
+# entity that is listed in that section
+_SECTION_TO_MODE = {
+    b"Publishers:": _PUBLISHERS,
+    b"Subscribers:": _SUBSCRIBERS,
+    b"Services:": _SERVICES,
+    b"Service Servers:": _SERVICES,
+    b"Service Clients:": _SERVICE_CLIENTS,
+    b"Action Servers:": _ACTION_SERVERS,
+    b"Action Clients:": _ACTION_CLIENTS,
+}
+
 if typing.TYPE_CHECKING:
     from .. import AppInstance
 
@@ -137,74 +152,73 @@ class ROS2StateProbe:
         topic_to_type: Dict[str, str] = {}
         service_to_type: Dict[str, str] = {}
         action_to_type: Dict[str, str] = {}
+        mode_to_types: Dict[str, Dict[str, str]] = {
+            _PUBLISHERS: topic_to_type,
+            _SUBSCRIBERS: topic_to_type,
+            _SERVICES: service_to_type,
+            _SERVICE_CLIENTS: service_to_type,
+            _ACTION_SERVERS: action_to_type,
+            _ACTION_CLIENTS: action_to_type,
+        }
 
-        command = "ros2 node list"
+        # fetch the info for all nodes with a single command, rather than
+        # executing a separate command for each node. the info for each node
+        # is preceded by a marker line that gives the name of that node.
+        # the node list is fetched first so that its failure is reported.
+        command = (
+            "nodes=$(ros2 node list) || exit 1; "
+            "for node in $nodes; do "
+            f'echo "{_NODE_MARKER.decode()}$node"; '
+            'ros2 node info "$node" || exit 1; '
+            "done"
+        )
         try:
-            output = shell.check_output(command, text=True)
+            output = shell.check_output(command, text=False)
         except dockerblade.exceptions.CalledProcessError:
-            logger.debug("Unable to retrieve rosnode list from command line")
+            logger.debug("Unable to retrieve node info from command line")
             raise
-        node_names = output.split("\r\n")
-        for node_name in node_names:
-            if node_name == "":
+
+        # parse the raw output in a single pass, using the section headers
+        # within the info for each node to determine the kind of each entry.
+        # only the names and types that are kept are decoded.
+        node_name = ""
+        mode: Optional[str] = None
+        types: Dict[str, str] = {}
+        for raw_line in output.splitlines():
+            line = raw_line.strip()
+            if not line:
                 continue
-            command_info = f"ros2 node info '{node_name}'"
-            mode: Optional[str] = None
-            types: Dict[str, str] = {}
-            try:
-                output = shell.check_output(command_info, text=True)
-            except dockerblade.exceptions.CalledProcessError:
-                logger.debug(f"Unable to retrieve '{command_info}'")
-                raise
-            output = output.replace(" ", "")
-            # Uses mode to parse line and add info to appropriate set
-            lines = output.split("\r\n")
-            for line in lines:
-                if "Publishers:" in line:
-                    mode = _PUBLISHERS
-                    types = topic_to_type
-                    continue
-                elif "Subscribers:" in line:
-                    mode = _SUBSCRIBERS
-                    types = topic_to_type
-                    continue
-                elif "Services:" in line:
-                    mode = _SERVICES
-                    types = service_to_type
-                    continue
-                elif "Action Servers:" in line:
-                    mode = _ACTION_SERVERS
-                    types = action_to_type
-                    continue
-                elif "Service Clients:" in line:
-                    mode = _SERVICE_CLIENTS
-                    types = service_to_type
-                    continue
-                elif "Action Clients:" in line:
-                    mode = _ACTION_CLIENTS
-                    types = action_to_type
-                    continue
-
-                if mode:
-                    partition = line.partition(":")
-                    name = partition[0]
-                    fmt = partition[1]
-                    if name in node_to_state[mode]:
-                        node_to_state[mode][name].add(node_name)
-                    else:
-                        node_to_state[mode][name] = {node_name}
-                    # Add type information and report conflict if a
-                    # different types was registered (probably
-                    # should never happen)
-                    if name in types and fmt != types[name]:
-                        logger.error(
-                            f'The entity {name} has conflicting types: '
-                            f'{types[name]} =/= {fmt}')
-                        raise ConflictingTypes(entity=name,
-                                               existing=types[name],
-                                               conflicting=fmt)
-                    else:
-                        types[name] = fmt
+            if line.startswith(_NODE_MARKER):
+                node_name = line[len(_NODE_MARKER):].decode("utf-8")
+                mode = None
+                continue
+            if not node_name:
+                continue
+            if line in _SECTION_TO_MODE:
+                mode = _SECTION_TO_MODE[line]
+                types = mode_to_types[mode]
+                continue
+
+            if mode:
+                bin_name, _, bin_fmt = line.partition(b":")
+                name = bin_name.decode("utf-8")
+                fmt = bin_fmt.strip().decode("utf-8")
+                if name in node_to_state[mode]:
+                    node_to_state[mode][name].add(node_name)
+                else:
+                    node_to_state[mode][name] = {node_name}
+                # Add type information and report conflict if a
+                # different types was registered (probably
+                # should never happen)
+                if name in types and fmt != types[name]:
+                    logger.error(
+                        f'The entity {name} has conflicting types: '
+                        f'{types[name]} =/= {fmt}')
+                    raise ConflictingTypes(entity=name,
+                                           existing=types[name],
+                                           conflicting=fmt)
+                else:
+                    types[name] = fmt
 
         state = ROS2SystemState(
             publishers=node_to_state[_PUBLISHERS],
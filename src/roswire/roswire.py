@@ -5,6 +5,7 @@ __all__ = ("ROSWire",)
 import contextlib
 import os
 import typing as t
+from types import TracebackType
 
 import dockerblade
 import yaml
@@ -56,6 +57,24 @@ class ROSWire:
     def __repr__(self) -> str:
         return f"ROSWire(workspace='{self.workspace}')"
 
+    def __enter__(self) -> "ROSWire":
+        return self
+
+    def __exit__(
+        self,
+        ex_type: t.Optional[t.Type[BaseException]],
+        ex_val: t.Optional[BaseException],
+        ex_tb: t.Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the Docker daemon that is shared by all
+        applications launched in this session.
+        """
+        self._dockerblade.close()
+
     @property
     def workspace(self) -> str:
         return self.__workspace
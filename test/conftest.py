@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-from typing import Iterator
+from typing import Callable, Dict, Iterator, Set
+import concurrent.futures
 import contextlib
 import os
 
@@ -16,13 +17,18 @@ DIR_HERE = os.path.dirname(__file__)
 logger.enable("roswire")
 
 
-def _app(name: str) -> roswire.App:
-    rsw = roswire.ROSWire()
-    filepath = os.path.join(DIR_HERE, "apps", f"{name}.yml")
+# the fixtures that provide a containerised app, either directly or to
+# other fixtures
+_APP_FIXTURES = ("app", "_sut_for_app")
+
+
+def _app_filepath(name: str) -> str:
+    return os.path.join(DIR_HERE, "apps", f"{name}.yml")
+
 
-    # ensure that the image for the app has been downloaded
-    docker_client = docker.from_env()
-    with open(filepath, "r") as f:
+def _ensure_image(docker_client: docker.DockerClient, name: str) -> None:
+    """Ensures that the image for a given app has been downloaded."""
+    with open(_app_filepath(name), "r") as f:
         contents = yaml.safe_load(f)
     image: str = contents["image"]
     try:
@@ -32,7 +38,62 @@ def _app(name: str) -> roswire.App:
         docker_client.images.pull(image)
         logger.debug(f"downloaded Docker image for testing: {image}")
 
-    return rsw.load(filepath)
+
+def _app(name: str) -> roswire.App:
+    rsw = roswire.ROSWire()
+    _ensure_image(docker.from_env(), name)
+    return rsw.load(_app_filepath(name))
+
+
+def _uses_app(item) -> bool:
+    # fixturenames includes the fixtures that are used indirectly
+    return any(f in item.fixturenames for f in _APP_FIXTURES)
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """Marks all tests that use a containerised app as heavy."""
+    for item in items:
+        if _uses_app(item):
+            item.add_marker(pytest.mark.heavy)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prefetch_images(request) -> None:
+    """
+    Downloads the images for all apps used by the selected tests in
+    parallel before any test runs, rather than one at a time as each app
+    is first launched.
+    """
+    # apps are given by name as the parameter of the fixture that uses them
+    names: Set[str] = set()
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if not callspec or item.get_closest_marker("skip"):
+            continue
+        if not _uses_app(item):
+            continue
+        names.update(
+            param
+            for param in callspec.params.values()
+            if isinstance(param, str) and os.path.isfile(_app_filepath(param))
+        )
+    if not names:
+        return
+
+    try:
+        docker_client = docker.from_env()
+    except docker.errors.DockerException:
+        logger.warning("unable to connect to Docker: not prefetching images")
+        return
+
+    def prefetch(name: str) -> None:
+        try:
+            _ensure_image(docker_client, name)
+        except docker.errors.DockerException:
+            logger.exception(f"failed to prefetch image for app: {name}")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(prefetch, sorted(names)))
 
 
 @contextlib.contextmanager
@@ -42,24 +103,53 @@ def _sut(name: str) -> Iterator[roswire.AppInstance]:
         yield app_instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def _sut_for_app() -> Iterator[Callable[[str], roswire.AppInstance]]:
+    """
+    Provides a function that returns a running instance of a given app.
+    Launching a container dominates the running time of most tests, so each
+    app is launched at most once per session and shared by all tests that
+    use it. Tests that use ROS start and stop their own ROS master.
+    """
+    with contextlib.ExitStack() as stack:
+        name_to_sut: Dict[str, roswire.AppInstance] = {}
+
+        def sut_for_app(name: str) -> roswire.AppInstance:
+            if name not in name_to_sut:
+                name_to_sut[name] = stack.enter_context(_sut(name))
+            return name_to_sut[name]
+
+        yield sut_for_app
+
+
+@pytest.fixture(scope="session")
 def app(request) -> roswire.App:
+    """
+    Provides a given app. Loading its description is costly and no test
+    modifies it, so each app is loaded once per session.
+    """
     return _app(request.param)
 
 
-@pytest.yield_fixture
-def sut(request) -> Iterator[roswire.AppInstance]:
-    with _sut(request.param) as sut:
-        yield sut
+@pytest.fixture
+def sut(request, _sut_for_app) -> Iterator[roswire.AppInstance]:
+    """
+    Provides a running instance of a given app. Tests that are marked as
+    isolated, such as those that launch nodes, are given their own instance
+    so that their nodes cannot leak into the state seen by other tests.
+    """
+    if request.node.get_closest_marker("isolated"):
+        with _sut(request.param) as app_instance:
+            yield app_instance
+    else:
+        yield _sut_for_app(request.param)
 
 
-@pytest.yield_fixture
-def filesystem(request) -> Iterator[dockerblade.files.FileSystem]:
-    with _sut(request.param) as sut:
-        yield sut.files
+@pytest.fixture
+def filesystem(request, _sut_for_app) -> dockerblade.files.FileSystem:
+    return _sut_for_app(request.param).files
 
 
-@pytest.yield_fixture
-def shell(request) -> Iterator[dockerblade.shell.Shell]:
-    with _sut(request.param) as sut:
-        yield sut.shell
+@pytest.fixture
+def shell(request, _sut_for_app) -> dockerblade.shell.Shell:
+    return _sut_for_app(request.param).shell
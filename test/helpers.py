@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""Provides utilities that are shared by the tests."""
+from typing import Callable
+import time
+
+
+def wait_until(
+    predicate: Callable[[], bool],
+    timeout: float,
+    interval: float = 0.05,
+    max_interval: float = 0.5,
+) -> None:
+    """
+    Polls a given predicate, backing off exponentially between attempts,
+    until it holds. Raises a TimeoutError if the predicate does not hold
+    within a given number of seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"condition not met after {timeout} seconds")
+        time.sleep(interval)
+        interval = min(interval * 2, max_interval)
@@ -1,18 +1,20 @@
 from typing import Iterator, Tuple
 import os
 import contextlib
-import logging
-import time
+import functools
 
 import pytest
 
-import roswire
-import roswire.exceptions
 from dockerblade import Shell, FileSystem
 from roswire import AppInstance, ROSWire, AppDescription, ROS1
 from roswire.common import TypeDatabase, FormatDatabase, PackageDatabase
 
+from helpers import wait_until
+
 DIR_TEST = os.path.dirname(__file__)
+FN_HELLO_WORLD_FORMATS = os.path.join(
+    DIR_TEST, "format-databases/helloworld.formats.yml"
+)
 
 
 def skip_if_on_travis(f):
@@ -22,20 +24,20 @@ def skip_if_on_travis(f):
         return f
 
 
+@functools.lru_cache(maxsize=None)
+def load_hello_world_format_db() -> FormatDatabase:
+    return FormatDatabase.load(FN_HELLO_WORLD_FORMATS)
+
+
+@functools.lru_cache(maxsize=None)
 def load_hello_world_type_db() -> TypeDatabase:
-    fn_db_format = os.path.join(
-        DIR_TEST, "format-databases/helloworld.formats.yml"
-    )
-    db_format = FormatDatabase.load(fn_db_format)
-    return TypeDatabase.build(db_format)
+    return TypeDatabase.build(load_hello_world_format_db())
 
 
+@functools.lru_cache(maxsize=None)
 def load_hello_world_description() -> AppDescription:
-    fn_db_format = os.path.join(
-        DIR_TEST, "format-databases/helloworld.formats.yml"
-    )
-    db_format = FormatDatabase.load(fn_db_format)
-    db_type = TypeDatabase.build(db_format)
+    db_format = load_hello_world_format_db()
+    db_type = load_hello_world_type_db()
     desc = AppDescription(
         sha256="foo",
         types=db_type,
@@ -45,50 +47,52 @@ def load_hello_world_description() -> AppDescription:
     return desc
 
 
+@functools.lru_cache(maxsize=None)
+def _roswire() -> ROSWire:
+    return ROSWire()
+
+
+@contextlib.contextmanager
+def _brass() -> Iterator[AppInstance]:
+    image = "brass"
+    desc = AppDescription(image, [], [], [])
+    with _roswire().launch(image, desc) as sut:
+        yield sut
+
+
 @contextlib.contextmanager
 def build_ardu() -> Iterator[Tuple[AppInstance, ROS1]]:
-    rsw = ROSWire()
-    with rsw.launch("brass") as sut:
+    with _roswire().launch("brass") as sut:
         with sut.ros1() as ros:
-            time.sleep(5)
+            wait_until(lambda: "/rosout" in ros.topic_to_type, timeout=10)
             yield (sut, ros)
 
 
 @contextlib.contextmanager
 def build_hello_world() -> Iterator[Tuple[AppInstance, ROS1]]:
-    rsw = ROSWire()
     image = "roswire/helloworld:buggy"
     desc = load_hello_world_description()
-    with rsw.launch(image, desc) as sut:
+    with _roswire().launch(image, desc) as sut:
         with sut.ros1() as ros:
-            time.sleep(5)
+            wait_until(lambda: "/rosout" in ros.topic_to_type, timeout=10)
             yield (sut, ros)
 
 
 @contextlib.contextmanager
 def build_shell_proxy() -> Iterator[Shell]:
-    rsw = ROSWire()
-    image = "brass"
-    desc = AppDescription(image, [], [], [])
-    with rsw.launch(image, desc) as sut:
+    with _brass() as sut:
         yield sut.shell
 
 
 @contextlib.contextmanager
 def build_file_proxy() -> Iterator[FileSystem]:
-    rsw = ROSWire()
-    image = "brass"
-    desc = AppDescription(image, [], [], [])
-    with rsw.launch(image, desc) as sut:
+    with _brass() as sut:
         yield sut.files
 
 
 @contextlib.contextmanager
 def build_file_and_shell_proxy() -> Iterator[Tuple[FileSystem, Shell]]:
-    rsw = ROSWire()
-    image = "brass"
-    desc = AppDescription(image, [], [], [])
-    with rsw.launch(image, desc) as sut:
+    with _brass() as sut:
         yield sut.files, sut.shell
 
 
@@ -105,11 +109,17 @@ def test_parameters(sut):
         assert "/rosdistro" in ros.parameters
 
         assert "/hello" not in ros.parameters
+        assert not ros.parameters.contains_cached("/hello")
         ros.parameters["/hello"] = "world"
         assert "/hello" in ros.parameters
         assert ros.parameters["/hello"] == "world"
+        assert ros.parameters.contains_cached("/hello")
+        assert ros.parameters.get_cached("/hello") == "world"
 
         del ros.parameters["/hello"]
         assert "hello" not in ros.parameters
+        assert not ros.parameters.contains_cached("/hello")
         with pytest.raises(KeyError):
             ros.parameters["/hello"]
+        with pytest.raises(KeyError):
+            ros.parameters.get_cached("/hello")
@@ -456,7 +456,7 @@ def test_msg_toposort(sut):
 
 
 def test_msg_flatten():
-    register: Dict[str, MsgFormat] = {}
+    register: Dict[str, ROS1MsgFormat] = {}
 
     def mf(name: str, definition: str) -> ROS1MsgFormat:
         f = ROS1MsgFormat.from_string("example_pkg", name, definition)
@@ -4,6 +4,7 @@ import pytest
 import roswire
 
 
+@pytest.mark.heavy
 @pytest.mark.skip(reason="this takes 10-15 minutes")
 def test_description():
     NAME_IMAGE = "hello-world"
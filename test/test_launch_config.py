@@ -0,0 +1,38 @@
+import pytest
+
+from roswire.common.launch.config import (
+    ExecutableType,
+    LaunchConfig,
+    NodeConfig,
+)
+from roswire.exceptions import FailedToParseLaunchFile
+
+
+def build_node(name: str, namespace: str = "/") -> NodeConfig:
+    return NodeConfig(
+        namespace=namespace,
+        name=name,
+        typ="talker",
+        package="demo",
+        executable_path="/opt/demo/talker",
+        executable_type=ExecutableType.LIKELY_CPP,
+    )
+
+
+def test_with_nodes():
+    config = LaunchConfig().with_node(build_node("a"))
+    updated = config.with_nodes([build_node("b"), build_node("c")])
+    assert {n.full_name for n in updated.nodes} == {"/a", "/b", "/c"}
+    assert {n.full_name for n in config.nodes} == {"/a"}
+
+    # nodes with the same name may be added to different namespaces
+    updated = config.with_nodes([build_node("a", namespace="/other")])
+    assert {n.full_name for n in updated.nodes} == {"/a", "/other/a"}
+
+
+def test_with_nodes_rejects_duplicate_names():
+    config = LaunchConfig().with_node(build_node("a"))
+    with pytest.raises(FailedToParseLaunchFile):
+        config.with_nodes([build_node("b"), build_node("a")])
+    with pytest.raises(FailedToParseLaunchFile):
+        LaunchConfig().with_nodes([build_node("b"), build_node("b")])
@@ -0,0 +1,14 @@
+from roswire.common.launch.context import LaunchContext
+
+
+def test_process_include_args_isolates_args():
+    parent = LaunchContext(filename="parent.launch")
+    ctx = parent.include_child(None, "child.launch")
+    ctx = ctx.with_arg("foo", value="1")
+    ctx = ctx.process_include_args()
+    assert ctx.resolve_dict["arg"] == {"foo": "1"}
+
+    child = ctx.with_arg("bar", value="2")
+    assert child.resolve_dict["arg"] == {"foo": "1", "bar": "2"}
+    assert ctx.resolve_dict["arg"] == {"foo": "1"}
+    assert "arg" not in parent.resolve_dict
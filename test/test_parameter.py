@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Dict, List
+
+import pytest
+
+import roswire.ros1.parameter
+from roswire.exceptions import ParameterNotFoundError
+from roswire.ros1.parameter import ParameterServer
+
+
+class FakeParameterServerAPI:
+    def __init__(self, params: Dict[str, Any]) -> None:
+        self.params = params
+        self.calls: List[str] = []
+
+    def getParam(self, caller_id: str, key: str):
+        self.calls.append(f"getParam {key}")
+        if key not in self.params:
+            return -1, "parameter not found", 0
+        return 1, "", self.params[key]
+
+    def setParam(self, caller_id: str, key: str, value: Any):
+        self.calls.append(f"setParam {key}")
+        self.params[key] = value
+        return 1, "", 0
+
+    def deleteParam(self, caller_id: str, key: str):
+        self.calls.append(f"deleteParam {key}")
+        if key not in self.params:
+            return -1, "parameter not found", 0
+        del self.params[key]
+        return 1, "", 0
+
+
+def test_cached_reads_reuse_recent_lookups():
+    api = FakeParameterServerAPI({"/rosdistro": "noetic"})
+    parameters = ParameterServer(api)
+
+    assert parameters.get_cached("/rosdistro") == "noetic"
+    assert parameters.get_cached("/rosdistro") == "noetic"
+    assert parameters.contains_cached("/rosdistro")
+    assert not parameters.contains_cached("/hello")
+    assert not parameters.contains_cached("/hello")
+    with pytest.raises(ParameterNotFoundError):
+        parameters.get_cached("/hello")
+    assert api.calls == ["getParam /rosdistro", "getParam /hello"]
+
+    # uncached reads always query the server
+    assert parameters["/rosdistro"] == "noetic"
+    assert api.calls[-1] == "getParam /rosdistro"
+
+
+def test_cached_reads_expire(monkeypatch):
+    api = FakeParameterServerAPI({"/rosdistro": "noetic"})
+    parameters = ParameterServer(api)
+    parameters.get_cached("/rosdistro")
+
+    monkeypatch.setattr(roswire.ros1.parameter, "CACHE_TTL", 0)
+    api.params["/rosdistro"] = "melodic"
+    assert parameters.get_cached("/rosdistro") == "melodic"
+    assert api.calls == ["getParam /rosdistro", "getParam /rosdistro"]
+
+
+def test_changes_invalidate_cached_reads():
+    api = FakeParameterServerAPI({})
+    parameters = ParameterServer(api)
+    assert not parameters.contains_cached("/hello")
+
+    parameters["/hello"] = "world"
+    assert parameters.contains_cached("/hello")
+    assert parameters.get_cached("/hello") == "world"
+
+    del parameters["/hello"]
+    assert not parameters.contains_cached("/hello")
+    with pytest.raises(ParameterNotFoundError):
+        parameters.get_cached("/hello")
+
+    assert api.calls == [
+        "getParam /hello",
+        "setParam /hello",
+        "getParam /hello",
+        "deleteParam /hello",
+        "getParam /hello",
+    ]
@@ -1,8 +1,19 @@
 from typing import Type
+import io
 
 import pytest
 
 from roswire.common.base import Time, Duration
+from roswire.common.decode import (
+    read_uint32,
+    simple_array_reader,
+    string_reader,
+)
+from roswire.common.encode import (
+    simple_array_writer,
+    string_writer,
+    write_uint32,
+)
 
 
 def test_duration_between():
@@ -48,3 +59,57 @@ def test_time_compare():
 
 def test_duration_compare():
     check_timelike(Duration)
+
+
+def test_string_round_trip():
+    write = string_writer()
+    read = string_reader()
+    b = io.BytesIO()
+    write("héllo wörld", b)
+    write("", b)
+    # the length prefix gives the number of bytes rather than characters
+    assert b.getvalue()[:4] == b"\x0d\x00\x00\x00"
+    b.seek(0)
+    assert read(b) == "héllo wörld"
+    assert read(b) == ""
+
+
+def test_fixed_length_string_round_trip():
+    write = string_writer(5)
+    read = string_reader(5)
+
+    # strings at the fixed length are written as is
+    b = io.BytesIO()
+    write("hello", b)
+    write_uint32(42, b)
+    assert b.getvalue()[:5] == b"hello"
+    b.seek(0)
+    assert read(b) == "hello"
+    assert read_uint32(b) == 42
+
+    # shorter strings are padded with null bytes
+    b = io.BytesIO()
+    write("hi", b)
+    write_uint32(42, b)
+    assert b.getvalue()[:5] == b"hi\x00\x00\x00"
+    b.seek(0)
+    assert read(b) == "hi\x00\x00\x00"
+    assert read_uint32(b) == 42
+
+
+@pytest.mark.parametrize(
+    "typ, values",
+    [
+        ("uint8", [0, 1, 127, 255]),
+        ("float64", [0.0, -1.5, 2.25, 1e-9, 3.0, 4.5, -6.75, 1e12, 9.0]),
+    ],
+)
+def test_fixed_length_array_round_trip(typ, values):
+    write = simple_array_writer(typ, len(values))
+    read = simple_array_reader(typ, len(values))
+    b = io.BytesIO()
+    write(values, b)
+    write_uint32(42, b)
+    b.seek(0)
+    assert read(b) == values
+    assert read_uint32(b) == 42
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+import json
+import subprocess
+from types import SimpleNamespace
+from typing import Dict, List, Union
+
+import pytest
+
+from roswire.app.instance import AppInstance
+from roswire.exceptions import LaunchFileNotFound
+
+
+class FakeShell:
+    def __init__(self, files: Dict[str, Union[str, bytes]]) -> None:
+        self.files = files
+        self.commands: List[str] = []
+
+    def check_output(self, command: str, text: bool) -> str:
+        self.commands.append(command)
+        if command.startswith("test -f /launch_extractor.py"):
+            tag = self.files.get("/launch_extractor.py.sha256", "")
+            assert isinstance(tag, str)
+            return tag if "/launch_extractor.py" in self.files else ""
+        output = subprocess.check_output(["bash", "-c", command], text=text)
+        return output.rstrip("\n")
+
+
+    def check_call(self, command: str) -> None:
+        self.commands.append(command)
+
+
+class FakeFiles:
+    def __init__(self, files: Dict[str, Union[str, bytes]]) -> None:
+        self.files = files
+        self.copies = 0
+
+    def isfile(self, path: str) -> bool:
+        return path in self.files
+
+    def read(self, path: str, binary: bool = False) -> Union[str, bytes]:
+        contents = self.files[path]
+        if isinstance(contents, str) and binary:
+            return contents.encode("utf-8")
+        return contents
+
+    def write(self, path: str, contents: str) -> None:
+        self.files[path] = contents
+
+    def copy_from_host(self, host_path: str, container_path: str) -> None:
+        self.copies += 1
+        self.files[container_path] = "script"
+
+
+class FakeContainer:
+    def __init__(self, files: Dict[str, Union[str, bytes]]) -> None:
+        self._shell = FakeShell(files)
+        self._files = FakeFiles(files)
+
+    def shell(self, path: str, sources: List[str]) -> FakeShell:
+        return self._shell
+
+    def filesystem(self) -> FakeFiles:
+        return self._files
+
+
+def build_instance(
+    files: Dict[str, Union[str, bytes]],
+    package_paths: Dict[str, str],
+) -> AppInstance:
+    packages = {
+        name: SimpleNamespace(path=path)
+        for name, path in package_paths.items()
+    }
+    app = SimpleNamespace(
+        sources=[],
+        sha256="0" * 64,
+        description=SimpleNamespace(packages=packages),
+    )
+    return AppInstance(dockerblade=FakeContainer(files), app=app)
+
+
+def build_node(name: str) -> Dict[str, str]:
+    return {
+        "__TYPE__": "Node",
+        "name": name,
+        "namespace": "/",
+        "package": "demo_nodes_cpp",
+        "executable_path": "/opt/ros/lib/demo_nodes_cpp/talker",
+        "executable_type": "LIKELY_CPP",
+    }
+
+
+@pytest.fixture
+def share(tmp_path):
+    launch_files = [
+        "demo_nodes_cpp/launch/talker.launch.py",
+        "demo_nodes_cpp/launch/listener.launch.py",
+        "demo_nodes_py/launch/talker.launch.py",
+    ]
+    for launch_file in launch_files:
+        path = tmp_path / launch_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("launch")
+    return tmp_path
+
+
+def build_share_instance(share) -> AppInstance:
+    packages = {
+        "demo_nodes_cpp": str(share / "demo_nodes_cpp"),
+        "demo_nodes_py": str(share / "demo_nodes_py"),
+        "missing": str(share / "missing"),
+    }
+    return build_instance({}, packages)
+
+
+def test_locate_reuses_located_files(share):
+    filename = str(share / "demo_nodes_cpp/launch/talker.launch.py")
+    sut = build_share_instance(share)
+    commands = sut.shell.commands
+
+    assert sut.ros2 is sut.ros2
+    located = sut.ros2.launch.locate(
+        "talker.launch.py", package="demo_nodes_cpp"
+    )
+    assert located == filename
+    assert len(commands) == 1
+
+    located = sut.ros2.launch.locate(
+        "talker.launch.py", package="demo_nodes_cpp"
+    )
+    assert located == filename
+    assert len(commands) == 1
+
+
+def test_locate_many_uses_a_single_command(share):
+    sut = build_share_instance(share)
+    commands = sut.shell.commands
+
+    located = sut.ros2.launch.locate_many([
+        ("talker.launch.py", "demo_nodes_cpp"),
+        ("talker.launch.py", "demo_nodes_py"),
+        ("listener.launch.py", "demo_nodes_cpp"),
+        ("/opt/other.launch.py", None),
+    ])
+    assert located == [
+        str(share / "demo_nodes_cpp/launch/talker.launch.py"),
+        str(share / "demo_nodes_py/launch/talker.launch.py"),
+        str(share / "demo_nodes_cpp/launch/listener.launch.py"),
+        "/opt/other.launch.py",
+    ]
+    assert len(commands) == 1
+
+    with pytest.raises(LaunchFileNotFound):
+        sut.ros2.launch.locate("listener.launch.py", package="demo_nodes_py")
+    with pytest.raises(LaunchFileNotFound):
+        sut.ros2.launch.locate("talker.launch.py", package="missing")
+
+
+def test_read_reuses_extracted_launch_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROSWIRE_LAUNCH_CACHE_DIR", str(tmp_path))
+    filename = "/opt/ros/share/demo_nodes_cpp/launch/talker.launch.py"
+    sut = build_instance(
+        {
+            filename: "launch",
+            "talker.launch.py.json": json.dumps([build_node("talker")]),
+        },
+        {},
+    )
+    commands = sut.shell.commands
+
+    config = sut.ros2.launch.read(filename)
+    assert [node.name for node in config.nodes] == ["talker"]
+    assert sum(c.startswith("python3") for c in commands) == 1
+
+    # the structure is kept in memory for as long as the instance is
+    for cached in tmp_path.iterdir():
+        cached.unlink()
+    assert sut.ros2.launch.read(filename) == config
+    assert sum(c.startswith("python3") for c in commands) == 1
+
+
+def test_read_copies_extraction_script_once():
+    filename = "/opt/ros/share/demo_nodes_cpp/launch/talker.launch.py"
+    sut = build_instance(
+        {
+            filename: "launch",
+            "talker.launch.py.json": json.dumps([build_node("talker")]),
+        },
+        {},
+    )
+    commands = sut.shell.commands
+
+    sut.ros2.launch.read(filename)
+    sut.ros2.launch.read(filename)
+    assert sut.files.copies == 1
+    assert sum(c.startswith("test -f") for c in commands) == 1
+    assert sum(c.startswith("python3") for c in commands) == 2
+
+    # an up-to-date copy of the script is reused by new instances
+    sut = build_instance(sut.files.files, {})
+    sut.ros2.launch.read(filename)
+    assert sut.files.copies == 0
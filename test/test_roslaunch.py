@@ -1,7 +1,66 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-import time
+import roswire.ros1.launch.reader
+from roswire.common.launch.context import LaunchContext
+from roswire.ros1.launch.reader import ROS1LaunchFileReader
+
+from helpers import wait_until
+
+
+def test_resolve_args_is_cached(monkeypatch):
+    resolved = []
+
+    class CountingResolver(roswire.ros1.launch.reader.ArgumentResolver):
+        def resolve(self, s: str) -> str:
+            resolved.append(s)
+            return super().resolve(s)
+
+    monkeypatch.setattr(
+        roswire.ros1.launch.reader, "ArgumentResolver", CountingResolver
+    )
+    reader = ROS1LaunchFileReader(shell=None, files=None)
+    ctx = LaunchContext(namespace="/", filename="/example.launch")
+    ctx = ctx.with_arg("robot", value="husky")
+    ctx = ctx.with_arg("world", value="empty")
+
+    s = "$(arg robot)_description"
+    assert reader._resolve_args(s, ctx) == "husky_description"
+    assert reader._resolve_args(s, ctx) == "husky_description"
+    assert resolved == [s]
+
+    # changes to args that aren't referenced by the string don't matter
+    other = ctx.with_arg("gui", value="true")
+    assert reader._resolve_args(s, other) == "husky_description"
+    assert resolved == [s]
+
+    # but changes to referenced args do
+    ctx = LaunchContext(namespace="/", filename="/example.launch")
+    ctx = ctx.with_arg("robot", value="jackal")
+    assert reader._resolve_args(s, ctx) == "jackal_description"
+    assert resolved == [s, s]
+
+
+def test_resolve_args_cache_is_cleared_by_read():
+    class FakeShell:
+        def __init__(self) -> None:
+            self.env = {"ROBOT": "husky"}
+
+        def environ(self, var: str) -> str:
+            return self.env[var]
+
+    class FakeFiles:
+        def read(self, fn: str) -> str:
+            return '<launch><env name="ROBOT" value="$(env ROBOT)"/></launch>'
+
+    shell = FakeShell()
+    reader = ROS1LaunchFileReader(shell=shell, files=FakeFiles())
+    config = reader.read("/example.launch")
+    assert config.envs["ROBOT"].value == "husky"
+
+    shell.env["ROBOT"] = "jackal"
+    config = reader.read("/example.launch")
+    assert config.envs["ROBOT"].value == "jackal"
 
 
 @pytest.mark.parametrize("sut", ["fetch"], indirect=True)
@@ -60,6 +119,7 @@ def test_eval_args_in_launch_file(sut):
 @pytest.mark.skip(
     reason="This is currently failing due to an Xacro parsing issue"
 )
+@pytest.mark.isolated
 @pytest.mark.parametrize("sut", ["fetch"], indirect=True)
 def test_remappings(sut):
     with sut.ros1() as ros:
@@ -71,8 +131,6 @@ def test_remappings(sut):
             },
         )
 
-        time.sleep(30)
-        state = ros.state
         expected_nodes = {
             "/cmd_vel_mux",
             "/gazebo",
@@ -82,6 +140,8 @@ def test_remappings(sut):
             "/robot_state_publisher",
             "/rosout",
         }
+        wait_until(lambda: ros.state.nodes == expected_nodes, timeout=45)
+        state = ros.state
         assert state.nodes == expected_nodes
         published_topics = set(state.publishers)
         assert "/gazebo/model_states" not in state.publishers
@@ -99,6 +159,7 @@ def test_locate_with_package_ros2(sut):
 
 
 @pytest.mark.skip(reason="ROS2 is not fully supported")
+@pytest.mark.isolated
 @pytest.mark.parametrize("sut", ["turtlebot3-ros2"], indirect=True)
 def test_launch_ros2(sut):
     actual_controller_command = sut.ros2.launch.launch(
@@ -111,6 +172,7 @@ def test_launch_ros2(sut):
 
 
 @pytest.mark.skip(reason="ROS2 is not fully supported")
+@pytest.mark.isolated
 @pytest.mark.parametrize("sut", ["turtlebot3-ros2"], indirect=True)
 def test_launch_with_full_path(sut):
     actual_controller_command = sut.ros2.launch.launch(
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+import roswire.ros1.service.manager
+from roswire.ros1.service.manager import ServiceManager
+
+
+class FakeMaster:
+    def __init__(self, name_to_url: Dict[str, str]) -> None:
+        self.name_to_url = name_to_url
+        self.calls: List[str] = []
+
+    def getSystemState(self, caller_id: str):
+        self.calls.append("getSystemState")
+        services = [[name, ["/node"]] for name in self.name_to_url]
+        return 1, "", [[], [], services]
+
+    def lookupService(self, caller_id: str, name: str):
+        self.calls.append(f"lookupService {name}")
+        if name not in self.name_to_url:
+            return -1, "unknown service", ""
+        return 1, "", self.name_to_url[name]
+
+
+class FakeShell:
+    def __init__(self) -> None:
+        self.commands: List[str] = []
+
+    def check_output(self, command: str, text: bool) -> str:
+        self.commands.append(command)
+        if command.startswith("for service in"):
+            names = command.split(" in ", 1)[1].split(";", 1)[0].split()
+            return "\n".join(
+                f"__roswire_service__:{name}\nstd_srvs/Empty"
+                for name in names
+            )
+        return "std_srvs/Empty"
+
+
+def build_manager(master: FakeMaster, shell: FakeShell) -> ServiceManager:
+    description = SimpleNamespace(
+        formats=SimpleNamespace(services={"std_srvs/Empty": "Empty"})
+    )
+    return ServiceManager(description, "172.17.0.2", master, shell)
+
+
+@pytest.fixture
+def master() -> FakeMaster:
+    return FakeMaster(
+        {
+            "/a": "rosrpc://container:4000",
+            "/b": "rosrpc://container:4001",
+        }
+    )
+
+
+def test_reuses_recent_lookups(master):
+    shell = FakeShell()
+    manager = build_manager(master, shell)
+
+    assert len(manager) == 2
+    assert len(manager) == 2
+    assert master.calls == ["getSystemState"]
+
+    service = manager["/a"]
+    assert service.url == "rosrpc://172.17.0.2:4000"
+    assert service.format == "Empty"
+    manager["/a"]
+    assert master.calls == ["getSystemState", "lookupService /a"]
+    assert len(shell.commands) == 1
+
+
+def test_recent_lookups_expire(master, monkeypatch):
+    shell = FakeShell()
+    manager = build_manager(master, shell)
+    manager["/a"]
+
+    monkeypatch.setattr(roswire.ros1.service.manager, "CACHE_TTL", 0)
+    manager["/a"]
+    assert master.calls == ["lookupService /a", "lookupService /a"]
+    # the service is still at the same URL, so its type is reused
+    assert len(shell.commands) == 1
+
+    # the type is fetched again once the service moves
+    master.name_to_url["/a"] = "rosrpc://container:5000"
+    assert manager["/a"].url == "rosrpc://172.17.0.2:5000"
+    assert len(shell.commands) == 2
+
+
+def test_iteration_prefetches_types(master):
+    shell = FakeShell()
+    manager = build_manager(master, shell)
+    services = dict(manager)
+    assert set(services) == {"/a", "/b"}
+    assert all(s.format == "Empty" for s in services.values())
+    assert len(shell.commands) == 1
+    assert shell.commands[0].startswith("for service in")
+
+
+def test_forgets_unregistered_services(master, monkeypatch):
+    monkeypatch.setattr(roswire.ros1.service.manager, "CACHE_TTL", 0)
+    shell = FakeShell()
+    manager = build_manager(master, shell)
+    manager["/a"]
+    assert len(shell.commands) == 1
+
+    # the type of the unregistered service is discarded when the set of
+    # services is next fetched
+    url = master.name_to_url.pop("/a")
+    assert len(manager) == 1
+    master.name_to_url["/a"] = url
+    manager["/a"]
+    assert shell.commands == ["rosservice type /a", "rosservice type /a"]
@@ -1,11 +1,95 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-import time
-
-import dockerblade
+from types import SimpleNamespace
+from typing import Iterator
 
+from roswire.common import SystemState
 from roswire.ros1.state import ROS1SystemState
+from roswire.ros2.state import ROS2StateProbe
+
+from helpers import wait_until
+
+
+@pytest.fixture(scope="module", params=["turtlebot3-ros2"])
+def ros2_state(request, _sut_for_app) -> Iterator[SystemState]:
+    """
+    Launches simple.launch.py once for all of the ROS 2 state tests in this
+    module and provides the state of the system once its nodes are up.
+    """
+    sut = _sut_for_app(request.param)
+    with sut.ros2.launch("simple.launch.py", package="launch"):
+        wait_until(
+            lambda: "/submap_list" in sut.ros2.state.publishers, timeout=30
+        )
+        yield sut.ros2.state
+
+
+_ROS2_NODE_INFO = (
+    b"__roswire_node__:/talker\r\n"
+    b"/talker\r\n"
+    b"  Subscribers:\r\n"
+    b"    /parameter_events: rcl_interfaces/msg/ParameterEvent\r\n"
+    b"  Publishers:\r\n"
+    b"    /chatter: std_msgs/msg/String\r\n"
+    b"    /rosout: rcl_interfaces/msg/Log\r\n"
+    b"  Service Servers:\r\n"
+    b"    /talker/get_parameters: rcl_interfaces/srv/GetParameters\r\n"
+    b"  Service Clients:\r\n"
+    b"\r\n"
+    b"  Action Servers:\r\n"
+    b"    /fibonacci: example_interfaces/action/Fibonacci\r\n"
+    b"  Action Clients:\r\n"
+    b"\r\n"
+    b"__roswire_node__:/listener\r\n"
+    b"/listener\r\n"
+    b"  Subscribers:\r\n"
+    b"    /chatter: std_msgs/msg/String\r\n"
+    b"  Publishers:\r\n"
+    b"    /rosout: rcl_interfaces/msg/Log\r\n"
+    b"  Service Servers:\r\n"
+    b"\r\n"
+    b"  Service Clients:\r\n"
+    b"    /talker/get_parameters: rcl_interfaces/srv/GetParameters\r\n"
+    b"  Action Servers:\r\n"
+    b"\r\n"
+    b"  Action Clients:\r\n"
+    b"    /fibonacci: example_interfaces/action/Fibonacci\r\n"
+)
+
+
+def test_ros2_state_probe_parses_node_info():
+    class FakeShell:
+        def check_output(self, command: str, text: bool) -> bytes:
+            return _ROS2_NODE_INFO
+
+    app_instance = SimpleNamespace(shell=FakeShell())
+    state = ROS2StateProbe(app_instance).probe()
+
+    assert state.nodes == {"/talker", "/listener"}
+    assert state.publishers == {
+        "/chatter": {"/talker"},
+        "/rosout": {"/talker", "/listener"},
+    }
+    assert state.subscribers == {
+        "/parameter_events": {"/talker"},
+        "/chatter": {"/listener"},
+    }
+    assert state.services == {"/talker/get_parameters": {"/talker"}}
+    assert state.service_clients == {"/talker/get_parameters": {"/listener"}}
+    assert state.action_servers == {"/fibonacci": {"/talker"}}
+    assert state.action_clients == {"/fibonacci": {"/listener"}}
+    assert state.topic_to_type == {
+        "/parameter_events": "rcl_interfaces/msg/ParameterEvent",
+        "/chatter": "std_msgs/msg/String",
+        "/rosout": "rcl_interfaces/msg/Log",
+    }
+    assert state.service_to_type == {
+        "/talker/get_parameters": "rcl_interfaces/srv/GetParameters",
+    }
+    assert state.action_to_type == {
+        "/fibonacci": "example_interfaces/action/Fibonacci",
+    }
 
 
 @pytest.mark.parametrize("sut", ["fetch"], indirect=True)
@@ -26,10 +110,8 @@ def test_state(sut):
 
 
 @pytest.mark.skip(reason="skipping ROS2 tests")
-@pytest.mark.parametrize("sut", ["turtlebot3-ros2"], indirect=True)
-def test_state_publishers(sut):
-    sut.ros2.launch("simple.launch.py", package="launch")
-    actual_state = sut.ros2.state
+def test_state_publishers(ros2_state):
+    actual_state = ros2_state
     actual_publishers = set(actual_state.publishers)
     expected_publishers = set(
         {
@@ -48,25 +130,19 @@ def test_state_publishers(sut):
 
 
 @pytest.mark.skip(reason="skipping ROS2 tests")
-@pytest.mark.parametrize("sut", ["turtlebot3-ros2"], indirect=True)
-def test_state_subscribers(sut):
-    sut.ros2.launch("simple.launch.py", package="launch")
-    actual_state = sut.ros2.state
+def test_state_subscribers(ros2_state):
+    actual_state = ros2_state
     actual_subscribers = set(actual_state.subscribers)
-    print(actual_subscribers)
     expected_subscribers = set(
-        {"/odom", "/scan", "/parameter_events", "/submap_list", "/imu", ""}
+        {"/odom", "/scan", "/parameter_events", "/submap_list", "/imu"}
     )
     assert actual_subscribers == expected_subscribers
 
 
 @pytest.mark.skip(reason="skipping ROS2 tests")
-@pytest.mark.parametrize("sut", ["turtlebot3-ros2"], indirect=True)
-def test_state_services(sut):
-    sut.ros2.launch("simple.launch.py", package="launch")
-    actual_state = sut.ros2.state
+def test_state_services(ros2_state):
+    actual_state = ros2_state
     actual_services = set(actual_state.services)
-    print(actual_services)
     expected_services = set(
         {
             "/cartographer_node/describe_parameters",